@@ -6,29 +6,73 @@ Fisheries Science Center (AFSC) as part of the National Oceanic and Atmospheric
 (NOAA Fisheries). Note that this is a community-provided library and is not officially endorsed by
 NOAA.
 
+Note that afscgap.flat, which requires requests and fastavro, is loaded on the first call to
+execute rather than on import so code needing that module directly should import it explicitly.
+
 (c) 2024 Regents of University of California / The Eric and Wendy Schmidt Center
 for Data Science and the Environment at UC Berkeley.
 
 This file is part of afscgap released under the BSD 3-Clause License. See
 LICENSE.md.
 """
+from __future__ import annotations
+
+import concurrent.futures
+import types
 import typing
 
+import afscgap.convert
 import afscgap.cursor
-import afscgap.flat
+import afscgap.flat_model
 import afscgap.param
 
+from afscgap.flat_model import PARAMS_DICT
+from afscgap.flat_model import WARN_FUNCTION
 from afscgap.typesdef import OPT_FLOAT
-from afscgap.typesdef import INT_PARAM
-from afscgap.typesdef import STR_PARAM
 from afscgap.typesdef import OPT_INT
 from afscgap.typesdef import OPT_STR
 from afscgap.typesdef import OPT_REQUESTOR
 
-WARN_FUNCTION = typing.Optional[typing.Callable[[str], None]]
-
 DEFAULT_URL = 'https://data.pyafscgap.org'
 
+DEFAULT_MAX_CONCURRENCY = 4
+
+EMPTY_PARAM = afscgap.param.EmptyParam()
+
+PARAM_STRATEGIES = {
+    'str': {
+        'empty': lambda eq, min_val, max_val: EMPTY_PARAM,
+        'equals': lambda eq, min_val, max_val: afscgap.param.StrEqualsParam(eq),
+        'range': lambda eq, min_val, max_val: afscgap.param.StrRangeParam(min_val, max_val)
+    },
+    'float': {
+        'empty': lambda eq, min_val, max_val: EMPTY_PARAM,
+        'equals': lambda eq, min_val, max_val: afscgap.param.FloatEqualsParam(eq),
+        'range': lambda eq, min_val, max_val: afscgap.param.FloatRangeParam(min_val, max_val)
+    },
+    'int': {
+        'empty': lambda eq, min_val, max_val: EMPTY_PARAM,
+        'equals': lambda eq, min_val, max_val: afscgap.param.IntEqualsParam(eq),
+        'range': lambda eq, min_val, max_val: afscgap.param.IntRangeParam(min_val, max_val)
+    }
+}
+
+# Param type by which values are given, indexed by (eq given, min given, max given) as three bits.
+# None indicates both range and equality values were provided.
+PARAM_TYPES = ('empty', 'range', 'range', 'range', 'equals', None, None, None)
+
+CPUE_WEIGHT_FIELDS = {
+    'kg/ha': 'cpue_kgha',
+    'kg/km2': 'cpue_kgkm2',
+    'kg1000/km2': 'cpue_kg1000km2'
+}
+
+CPUE_COUNT_FIELDS = {
+    'count/ha': 'cpue_noha',
+    'count/km2': 'cpue_nokm2',
+    'count1000/km2': 'cpue_no1000km2'
+}
+
 
 class Query:
     """Entrypoint for the AFSC GAP Python library.
@@ -37,6 +81,20 @@ class Query:
     queries.
     """
 
+    __slots__ = (
+        '_base_url',
+        '_requestor',
+        '_params',
+        '_params_snapshot',
+        '_meta_snapshot',
+        '_limit',
+        '_filter_incomplete',
+        '_presence_only',
+        '_suppress_large_warning',
+        '_warn_function',
+        '_prefetch_depth'
+    )
+
     def __init__(self, base_url: OPT_STR = None, requestor: OPT_REQUESTOR = None):
         """Create a new Query.
 
@@ -50,40 +108,9 @@ class Query:
         self._base_url = base_url
         self._requestor = requestor
 
-        # Filter parameters
-        self._year: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._srvy: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._survey: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._survey_id: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._cruise: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._haul: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._stratum: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._station: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._vessel_name: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._vessel_id: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._date_time: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._latitude_dd: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._longitude_dd: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._species_code: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._common_name: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._scientific_name: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._taxon_confidence: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._cpue_kgha: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._cpue_kgkm2: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._cpue_kg1000km2: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._cpue_noha: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._cpue_nokm2: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._cpue_no1000km2: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._weight_kg: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._count: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._bottom_temperature_c: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._surface_temperature_c: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._depth_m: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._distance_fished_km: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._net_width_m: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._net_height_m: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._area_swept_ha: afscgap.param.Param = afscgap.param.EmptyParam()
-        self._duration_hr: afscgap.param.Param = afscgap.param.EmptyParam()
+        # Filter parameters, with fields lacking a filter left absent
+        self._params: typing.Dict[str, afscgap.param.Param] = {}
+        self._params_snapshot: typing.Optional[PARAMS_DICT] = None
 
         # Query pararmeters
         self._limit: OPT_INT = None
@@ -91,6 +118,8 @@ class Query:
         self._presence_only: bool = False
         self._suppress_large_warning: bool = False
         self._warn_function: WARN_FUNCTION = None
+        self._prefetch_depth: int = afscgap.flat_model.DEFAULT_PREFETCH_DEPTH
+        self._meta_snapshot: typing.Optional[afscgap.flat_model.ExecuteMetaParams] = None
 
     def filter_year(self, eq: OPT_FLOAT = None, min_val: OPT_FLOAT = None,
         max_val: OPT_FLOAT = None) -> 'Query':
@@ -114,10 +143,9 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._year = self._create_float_param(eq, min_val, max_val)
-        return self
+        return self._set_param('year', 'float', eq, min_val, max_val)
 
-    def filter_srvy(self, eq: STR_PARAM = None, min_val: OPT_STR = None,
+    def filter_srvy(self, eq: OPT_STR = None, min_val: OPT_STR = None,
         max_val: OPT_STR = None) -> 'Query':
         """Filter on haul survey short name.
 
@@ -141,10 +169,9 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._srvy = self._create_str_param(eq, min_val, max_val)
-        return self
+        return self._set_param('srvy', 'str', eq, min_val, max_val)
 
-    def filter_survey(self, eq: STR_PARAM = None, min_val: OPT_STR = None,
+    def filter_survey(self, eq: OPT_STR = None, min_val: OPT_STR = None,
         max_val: OPT_STR = None) -> 'Query':
         """Filter on survey long name.
 
@@ -165,8 +192,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._survey = self._create_str_param(eq, min_val, max_val)
-        return self
+        return self._set_param('survey', 'str', eq, min_val, max_val)
 
     def filter_survey_id(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None) -> 'Query':
@@ -189,8 +215,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._survey_id = self._create_float_param(eq, min_val, max_val)
-        return self
+        return self._set_param('survey_id', 'float', eq, min_val, max_val)
 
     def filter_cruise(self, eq: OPT_FLOAT = None, min_val: OPT_FLOAT = None,
         max_val: OPT_FLOAT = None) -> 'Query':
@@ -213,8 +238,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._cruise = self._create_float_param(eq, min_val, max_val)
-        return self
+        return self._set_param('cruise', 'float', eq, min_val, max_val)
 
     def filter_haul(self, eq: OPT_FLOAT = None, min_val: OPT_FLOAT = None,
         max_val: OPT_FLOAT = None) -> 'Query':
@@ -237,8 +261,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._haul = self._create_float_param(eq, min_val, max_val)
-        return self
+        return self._set_param('haul', 'float', eq, min_val, max_val)
 
     def filter_stratum(self, eq: OPT_FLOAT = None, min_val: OPT_FLOAT = None,
         max_val: OPT_FLOAT = None) -> 'Query':
@@ -261,10 +284,9 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._stratum = self._create_float_param(eq, min_val, max_val)
-        return self
+        return self._set_param('stratum', 'float', eq, min_val, max_val)
 
-    def filter_station(self, eq: STR_PARAM = None, min_val: OPT_STR = None,
+    def filter_station(self, eq: OPT_STR = None, min_val: OPT_STR = None,
         max_val: OPT_STR = None) -> 'Query':
         """Filter on station associated with the survey.
 
@@ -285,10 +307,9 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._station = self._create_str_param(eq, min_val, max_val)
-        return self
+        return self._set_param('station', 'str', eq, min_val, max_val)
 
-    def filter_vessel_name(self, eq: STR_PARAM = None,
+    def filter_vessel_name(self, eq: OPT_STR = None,
         min_val: OPT_STR = None, max_val: OPT_STR = None) -> 'Query':
         """Filter on unique ID describing the vessel that made this observation.
 
@@ -309,8 +330,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._vessel_name = self._create_str_param(eq, min_val, max_val)
-        return self
+        return self._set_param('vessel_name', 'str', eq, min_val, max_val)
 
     def filter_vessel_id(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None) -> 'Query':
@@ -333,10 +353,9 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._vessel_id = self._create_float_param(eq, min_val, max_val)
-        return self
+        return self._set_param('vessel_id', 'float', eq, min_val, max_val)
 
-    def filter_date_time(self, eq: STR_PARAM = None, min_val: OPT_STR = None,
+    def filter_date_time(self, eq: OPT_STR = None, min_val: OPT_STR = None,
         max_val: OPT_STR = None) -> 'Query':
         """Filter on the date and time of the haul.
 
@@ -361,8 +380,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._date_time = self._create_str_param(eq, min_val, max_val)
-        return self
+        return self._set_param('date_time', 'str', eq, min_val, max_val)
 
     def filter_latitude(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -388,12 +406,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._latitude_dd = self._create_float_param(
-            afscgap.convert.convert(eq, units, 'dd'),
-            afscgap.convert.convert(min_val, units, 'dd'),
-            afscgap.convert.convert(max_val, units, 'dd')
+        return self._set_param_converted(
+            'latitude_dd',
+            units,
+            'dd',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def filter_longitude(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -419,12 +439,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._longitude_dd = self._create_float_param(
-            afscgap.convert.convert(eq, units, 'dd'),
-            afscgap.convert.convert(min_val, units, 'dd'),
-            afscgap.convert.convert(max_val, units, 'dd')
+        return self._set_param_converted(
+            'longitude_dd',
+            units,
+            'dd',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def filter_species_code(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None) -> 'Query':
@@ -447,10 +469,9 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._species_code = self._create_float_param(eq, min_val, max_val)
-        return self
+        return self._set_param('species_code', 'float', eq, min_val, max_val)
 
-    def filter_common_name(self, eq: STR_PARAM = None, min_val: OPT_STR = None,
+    def filter_common_name(self, eq: OPT_STR = None, min_val: OPT_STR = None,
         max_val: OPT_STR = None) -> 'Query':
         """Filter on the "common name" associated with the species observed.
 
@@ -471,10 +492,9 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._common_name = self._create_str_param(eq, min_val, max_val)
-        return self
+        return self._set_param('common_name', 'str', eq, min_val, max_val)
 
-    def filter_scientific_name(self, eq: STR_PARAM = None,
+    def filter_scientific_name(self, eq: OPT_STR = None,
         min_val: OPT_STR = None, max_val: OPT_STR = None) -> 'Query':
         """Filter on the "scientific name" associated with the species observed.
 
@@ -495,10 +515,9 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._scientific_name = self._create_str_param(eq, min_val, max_val)
-        return self
+        return self._set_param('scientific_name', 'str', eq, min_val, max_val)
 
-    def filter_taxon_confidence(self, eq: STR_PARAM = None,
+    def filter_taxon_confidence(self, eq: OPT_STR = None,
         min_val: OPT_STR = None, max_val: OPT_STR = None) -> 'Query':
         """Filter on confidence flag regarding ability to identify species.
 
@@ -519,8 +538,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._taxon_confidence = self._create_str_param(eq, min_val, max_val)
-        return self
+        return self._set_param('taxon_confidence', 'str', eq, min_val, max_val)
 
     def filter_cpue_weight(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -547,22 +565,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        param = self._create_float_param(eq, min_val, max_val)
-
-        self._cpue_kgha = afscgap.param.EmptyParam()
-        self._cpue_kgkm2 = afscgap.param.EmptyParam()
-        self._cpue_kg1000km2 = afscgap.param.EmptyParam()
-
-        if units == 'kg/ha':
-            self._cpue_kgha = param
-        elif units == 'kg/km2':
-            self._cpue_kgkm2 = param
-        elif units == 'kg1000/km2':
-            self._cpue_kg1000km2 = param
-        else:
-            raise RuntimeError('Unrecognized units ' + units)
-
-        return self
+        return self._set_param_for_units(CPUE_WEIGHT_FIELDS, units, eq, min_val, max_val)
 
     def filter_cpue_count(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -589,22 +592,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        param = self._create_float_param(eq, min_val, max_val)
-
-        self._cpue_noha = afscgap.param.EmptyParam()
-        self._cpue_nokm2 = afscgap.param.EmptyParam()
-        self._cpue_no1000km2 = afscgap.param.EmptyParam()
-
-        if units == 'count/ha':
-            self._cpue_noha = param
-        elif units == 'count/km2':
-            self._cpue_nokm2 = param
-        elif units == 'count1000/km2':
-            self._cpue_no1000km2 = param
-        else:
-            raise RuntimeError('Unrecognized units ' + units)
-
-        return self
+        return self._set_param_for_units(CPUE_COUNT_FIELDS, units, eq, min_val, max_val)
 
     def filter_weight(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -630,12 +618,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._weight_kg = self._create_float_param(
-            afscgap.convert.convert(eq, units, 'kg'),
-            afscgap.convert.convert(min_val, units, 'kg'),
-            afscgap.convert.convert(max_val, units, 'kg')
+        return self._set_param_converted(
+            'weight_kg',
+            units,
+            'kg',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def filter_count(self, eq: OPT_FLOAT = None, min_val: OPT_FLOAT = None,
         max_val: OPT_FLOAT = None) -> 'Query':
@@ -658,8 +648,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._count = self._create_float_param(eq, min_val, max_val)
-        return self
+        return self._set_param('count', 'float', eq, min_val, max_val)
 
     def filter_bottom_temperature(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -687,12 +676,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._bottom_temperature_c = self._create_float_param(
-            afscgap.convert.convert(eq, units, 'c'),
-            afscgap.convert.convert(min_val, units, 'c'),
-            afscgap.convert.convert(max_val, units, 'c')
+        return self._set_param_converted(
+            'bottom_temperature_c',
+            units,
+            'c',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def filter_surface_temperature(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -720,12 +711,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._surface_temperature_c = self._create_float_param(
-            afscgap.convert.convert(eq, units, 'c'),
-            afscgap.convert.convert(min_val, units, 'c'),
-            afscgap.convert.convert(max_val, units, 'c')
+        return self._set_param_converted(
+            'surface_temperature_c',
+            units,
+            'c',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def filter_depth(self, eq: OPT_FLOAT = None, min_val: OPT_FLOAT = None,
         max_val: OPT_FLOAT = None, units: str = 'm') -> 'Query':
@@ -750,12 +743,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._depth_m = self._create_float_param(
-            afscgap.convert.convert(eq, units, 'm'),
-            afscgap.convert.convert(min_val, units, 'm'),
-            afscgap.convert.convert(max_val, units, 'm')
+        return self._set_param_converted(
+            'depth_m',
+            units,
+            'm',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def filter_distance_fished(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -781,15 +776,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        def convert_to_km(target, units):
-            return afscgap.convert.convert(target, units, 'km')
-
-        self._distance_fished_km = self._create_float_param(
-            convert_to_km(eq, units),
-            convert_to_km(min_val, units),
-            convert_to_km(max_val, units)
+        return self._set_param_converted(
+            'distance_fished_km',
+            units,
+            'km',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def filter_net_width(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -815,12 +809,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._net_width_m = self._create_float_param(
-            afscgap.convert.convert(eq, units, 'm'),
-            afscgap.convert.convert(min_val, units, 'm'),
-            afscgap.convert.convert(max_val, units, 'm')
+        return self._set_param_converted(
+            'net_width_m',
+            units,
+            'm',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def filter_net_height(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -846,12 +842,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._net_height_m = self._create_float_param(
-            afscgap.convert.convert(eq, units, 'm'),
-            afscgap.convert.convert(min_val, units, 'm'),
-            afscgap.convert.convert(max_val, units, 'm')
+        return self._set_param_converted(
+            'net_height_m',
+            units,
+            'm',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def filter_area_swept(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -877,12 +875,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._area_swept_ha = self._create_float_param(
-            afscgap.convert.convert(eq, units, 'ha'),
-            afscgap.convert.convert(min_val, units, 'ha'),
-            afscgap.convert.convert(max_val, units, 'ha')
+        return self._set_param_converted(
+            'area_swept_ha',
+            units,
+            'ha',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def filter_duration(self, eq: OPT_FLOAT = None,
         min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None,
@@ -908,12 +908,14 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._duration_hr = self._create_float_param(
-            afscgap.convert.convert(eq, units, 'hr'),
-            afscgap.convert.convert(min_val, units, 'hr'),
-            afscgap.convert.convert(max_val, units, 'hr')
+        return self._set_param_converted(
+            'duration_hr',
+            units,
+            'hr',
+            eq,
+            min_val,
+            max_val
         )
-        return self
 
     def set_limit(self, limit: OPT_INT) -> 'Query':
         """Set the max number of results.
@@ -928,8 +930,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._limit = limit
-        return self
+        return self._set_meta('_limit', limit)
 
     def set_filter_incomplete(self, filter_incomplete: bool) -> 'Query':
         """Indicate if incomplete records should be filtered out.
@@ -947,8 +948,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._filter_incomplete = filter_incomplete
-        return self
+        return self._set_meta('_filter_incomplete', filter_incomplete)
 
     def set_presence_only(self, presence_only: bool) -> 'Query':
         """Indicate if zero catch inference should be enabled.
@@ -965,8 +965,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._presence_only = presence_only
-        return self
+        return self._set_meta('_presence_only', presence_only)
 
     def set_suppress_large_warning(self, supress: bool) -> 'Query':
         """Indicate if the large results warning should be supressed.
@@ -982,8 +981,7 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._suppress_large_warning = supress
-        return self
+        return self._set_meta('_suppress_large_warning', supress)
 
     def set_warn_function(self, warn_function: WARN_FUNCTION) -> 'Query':
         """Indicate how warnings should be emitted.
@@ -998,9 +996,83 @@ class Query:
         Returns:
             This object for chaining if desired.
         """
-        self._warn_function = warn_function
+        return self._set_meta('_warn_function', warn_function)
+
+    def set_prefetch_depth(self, prefetch_depth: int) -> 'Query':
+        """Indicate how many flat files may be downloaded ahead of iteration.
+
+        Indicate how many flat files may be downloaded in the background ahead
+        of the records currently being iterated, overwritting the prior
+        prefetch settings on this Query.
+
+        Args:
+            prefetch_depth: The maximum number of flat files to request ahead
+                of the records currently being iterated. Higher values overlap
+                more network requests but may download files which are not
+                used if iteration stops early. If zero, files are requested one
+                at a time only when needed. Defaults to 4.
+
+        Returns:
+            This object for chaining if desired.
+        """
+        return self._set_meta('_prefetch_depth', prefetch_depth)
+
+    def filter_from_dict(self, spec: typing.Dict[str, dict]) -> 'Query':
+        """Apply a set of filters described by a dictionary.
+
+        Apply a set of filters described by a dictionary like one loaded from
+        configuration, calling the filter method for each field such that all
+        prior filters on those fields are overwritten.
+
+        Args:
+            spec: Mapping from the name of the filter like year (for
+                filter_year) to the keyword arguments for that filter like
+                {'eq': 2021} or {'min_val': 56, 'max_val': 57, 'units': 'dd'}.
+
+        Raises:
+            RuntimeError: Raised if a filter is not recognized.
+
+        Returns:
+            This object for chaining if desired.
+        """
+        for name, kwargs in spec.items():
+            method = getattr(self, 'filter_' + name, None)
+
+            if method is None or name == 'from_dict':
+                raise RuntimeError('Unrecognized filter ' + name)
+
+            method(**kwargs)
+
         return self
 
+    def copy(self) -> 'Query':
+        """Create a new Query with the same filters and settings as this one.
+
+        Create a new Query with the same filters and settings as this one such
+        that later changes to either Query do not impact the other. This can
+        be used to vary a single filter across many queries which otherwise
+        share the same configuration without rebuilding each from scratch.
+
+        Returns:
+            Newly created Query.
+        """
+        query_type = type(self)
+        new_query = query_type.__new__(query_type)
+
+        # Include slots added by subclasses along with any attributes kept outside of slots.
+        for cls in query_type.__mro__:
+            slots = getattr(cls, '__slots__', ())
+            names = (slots,) if isinstance(slots, str) else slots
+            for name in names:
+                if name not in ('__dict__', '__weakref__') and hasattr(self, name):
+                    setattr(new_query, name, getattr(self, name))
+
+        if hasattr(self, '__dict__'):
+            new_query.__dict__.update(self.__dict__)
+
+        new_query._params = dict(self._params)
+        return new_query
+
     def execute(self) -> afscgap.cursor.Cursor:
         """Execute the query built up in this object.
 
@@ -1011,59 +1083,56 @@ class Query:
         Returns:
             Cursor to manage HTTP requests and query results.
         """
-        params_dict = {
-            'year': self._year,
-            'srvy': self._srvy,
-            'survey': self._survey,
-            'survey_id': self._survey_id,
-            'cruise': self._cruise,
-            'haul': self._haul,
-            'stratum': self._stratum,
-            'station': self._station,
-            'vessel_name': self._vessel_name,
-            'vessel_id': self._vessel_id,
-            'date_time': self._date_time,
-            'latitude_dd': self._latitude_dd,
-            'longitude_dd': self._longitude_dd,
-            'species_code': self._species_code,
-            'common_name': self._common_name,
-            'scientific_name': self._scientific_name,
-            'taxon_confidence': self._taxon_confidence,
-            'cpue_kgha': self._cpue_kgha,
-            'cpue_kgkm2': self._cpue_kgkm2,
-            'cpue_kg1000km2': self._cpue_kg1000km2,
-            'cpue_noha': self._cpue_noha,
-            'cpue_nokm2': self._cpue_nokm2,
-            'cpue_no1000km2': self._cpue_no1000km2,
-            'weight_kg': self._weight_kg,
-            'count': self._count,
-            'bottom_temperature_c': self._bottom_temperature_c,
-            'surface_temperature_c': self._surface_temperature_c,
-            'depth_m': self._depth_m,
-            'distance_fished_km': self._distance_fished_km,
-            'net_width_m': self._net_width_m,
-            'net_height_m': self._net_height_m,
-            'area_swept_ha': self._area_swept_ha,
-            'duration_hr': self._duration_hr
-        }
-
-        meta_params = afscgap.flat_model.ExecuteMetaParams(
-            self._base_url if self._base_url else DEFAULT_URL,
-            self._requestor,
-            self._limit,
-            self._filter_incomplete,
-            self._presence_only,
-            self._suppress_large_warning,
-            self._warn_function
-        )
+        # Deferred so that importing afscgap does not load the HTTP / Avro stack until needed.
+        import afscgap.flat
+
+        # Read-only so the snapshot shared across executes cannot be changed by a consumer.
+        if self._params_snapshot is None:
+            self._params_snapshot = types.MappingProxyType(dict(self._params))
+
+        params_dict = self._params_snapshot
+
+        if self._meta_snapshot is None:
+            self._meta_snapshot = afscgap.flat_model.ExecuteMetaParams(
+                self._base_url if self._base_url else DEFAULT_URL,
+                self._requestor,
+                self._limit,
+                self._filter_incomplete,
+                self._presence_only,
+                self._suppress_large_warning,
+                self._warn_function,
+                self._prefetch_depth
+            )
+
+        meta_params = self._meta_snapshot
 
         return afscgap.flat.execute(params_dict, meta_params)
 
-    def _create_str_param(self, eq: STR_PARAM = None, min_val: OPT_STR = None,
-        max_val: OPT_STR = None) -> afscgap.param.Param:
-        """Create a new string parameter.
+    def _set_meta(self, attribute: str, value) -> 'Query':
+        """Update a setting used to build the ExecuteMetaParams for this query.
+
+        Args:
+            attribute: The name of the attribute like _limit to update.
+            value: The new value for the setting.
+
+        Returns:
+            This object for chaining if desired.
+        """
+        # Keep the cached meta params when a chained call sets the value already in use.
+        if getattr(self, attribute) is not value:
+            setattr(self, attribute, value)
+            self._meta_snapshot = None
+
+        return self
+
+    def _set_param(self, field: str, data_type: str, eq=None, min_val=None,
+        max_val=None) -> 'Query':
+        """Create a new parameter and use it as the filter for a field.
 
         Args:
+            field: The name of the field like year on which the filter operates. This overwrites all
+                prior filters on this field.
+            data_type: The type of parameter to create: str, float, or int.
             eq: The exact value that must be matched for a record to be
                 returned. Pass None if no equality filter should be applied.
                 Error thrown if min_val or max_val also provided.
@@ -1075,22 +1144,25 @@ class Query:
                 thrown if eq also proivded.
 
         Returns:
-            Newly initalized parameter.
+            This object for chaining if desired.
         """
-        param_type = self._get_param_type(eq, min_val, max_val)
-        strategy = {
-            'empty': lambda: afscgap.param.EmptyParam(),
-            'equals': lambda: afscgap.param.StrEqualsParam(eq),  # type: ignore
-            'range': lambda: afscgap.param.StrRangeParam(min_val, max_val)  # type: ignore
-        }[param_type]
-        return strategy()  # type: ignore
-
-    def _create_float_param(self, eq: OPT_FLOAT = None,
-        min_val: OPT_FLOAT = None,
-        max_val: OPT_FLOAT = None) -> afscgap.param.Param:
-        """Create a new float parameter.
+        if eq is None and min_val is None and max_val is None:
+            self._clear_param(field)
+        else:
+            self._params[field] = self._create_param(data_type, eq, min_val, max_val)
+            self._params_snapshot = None
+
+        return self
+
+    def _set_param_converted(self, field: str, units: str, system_units: str,
+        eq: OPT_FLOAT = None, min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None) -> 'Query':
+        """Set a float filter on a field after converting values to the units used by that field.
 
         Args:
+            field: The name of the field like depth_m on which the filter operates. This overwrites
+                all prior filters on this field.
+            units: The units in which the filter values are provided.
+            system_units: The units in which the field is stored like m.
             eq: The exact value that must be matched for a record to be
                 returned. Pass None if no equality filter should be applied.
                 Error thrown if min_val or max_val also provided.
@@ -1102,21 +1174,71 @@ class Query:
                 thrown if eq also proivded.
 
         Returns:
-            Newly initalized parameter.
+            This object for chaining if desired.
         """
-        param_type = self._get_param_type(eq, min_val, max_val)
-        strategy = {
-            'empty': lambda: afscgap.param.EmptyParam(),
-            'equals': lambda: afscgap.param.FloatEqualsParam(eq),    # type: ignore
-            'range': lambda: afscgap.param.FloatRangeParam(min_val, max_val)   # type: ignore
-        }[param_type]
-        return strategy()  # type: ignore
+        if eq is None and min_val is None and max_val is None:
+            return self._set_param(field, 'float')
+
+        # Values given in the units of the field (the default for all filters) need no conversion.
+        if units == system_units:
+            return self._set_param(field, 'float', eq, min_val, max_val)
+
+        # Look up the converter once rather than for each of the three values.
+        converter = afscgap.convert.get_converter(units, system_units)
+        converted = map(lambda x: None if x is None else converter(x), (eq, min_val, max_val))
+        eq_converted, min_converted, max_converted = converted
+
+        return self._set_param(field, 'float', eq_converted, min_converted, max_converted)
+
+    def _set_param_for_units(self, fields_by_units: typing.Dict[str, str], units: str,
+        eq: OPT_FLOAT = None, min_val: OPT_FLOAT = None, max_val: OPT_FLOAT = None) -> 'Query':
+        """Set a float filter on the field matching the given units, clearing its sibling fields.
+
+        Args:
+            fields_by_units: Mapping from units to the field storing values in those units like
+                CPUE_WEIGHT_FIELDS. Filters on all fields in this mapping are overwritten.
+            units: The units in which the filter values are provided.
+            eq: The exact value that must be matched for a record to be
+                returned. Pass None if no equality filter should be applied.
+                Error thrown if min_val or max_val also provided.
+            min_val: The minimum allowed value, inclusive. Pass None if no
+                minimum value filter should be applied. Defaults to None. Error
+                thrown if eq also proivded.
+            max_val: The maximum allowed value, inclusive. Pass None if no
+                maximum value filter should be applied. Defaults to None. Error
+                thrown if eq also proivded.
+
+        Returns:
+            This object for chaining if desired.
+        """
+        if units not in fields_by_units:
+            raise RuntimeError('Unrecognized units ' + units)
+
+        param = self._create_param('float', eq, min_val, max_val)
 
-    def _create_int_param(self, eq: INT_PARAM = None, min_val: OPT_INT = None,
-        max_val: OPT_INT = None) -> afscgap.param.Param:
-        """Create a new int parameter.
+        for field in fields_by_units.values():
+            self._clear_param(field)
+
+        if not param.get_is_ignorable():
+            self._params[fields_by_units[units]] = param
+
+        return self
+
+    def _clear_param(self, field: str):
+        """Remove the filter on a field if present.
 
         Args:
+            field: The name of the field like year whose filter should be removed.
+        """
+        self._params.pop(field, None)
+        self._params_snapshot = None
+
+    def _create_param(self, data_type: str, eq=None, min_val=None,
+        max_val=None) -> afscgap.param.Param:
+        """Create a new parameter using the strategies in PARAM_STRATEGIES.
+
+        Args:
+            data_type: The type of parameter to create: str, float, or int.
             eq: The exact value that must be matched for a record to be
                 returned. Pass None if no equality filter should be applied.
                 Error thrown if min_val or max_val also provided.
@@ -1127,16 +1249,19 @@ class Query:
                 maximum value filter should be applied. Defaults to None. Error
                 thrown if eq also proivded.
 
+        Raises:
+            RuntimeError: Raised if both equality and range values are provided or if given a
+                dictionary describing an ORDS query, which is not supported by the flat files.
+
         Returns:
             Newly initalized parameter.
         """
+        if isinstance(eq, dict) or isinstance(min_val, dict) or isinstance(max_val, dict):
+            raise RuntimeError('ORDS query dictionaries are not supported. Use min_val / max_val.')
+
         param_type = self._get_param_type(eq, min_val, max_val)
-        strategy = {
-            'empty': lambda: afscgap.param.EmptyParam(),
-            'equals': lambda: afscgap.param.IntEqualsParam(eq),  # type: ignore
-            'range': lambda: afscgap.param.IntRangeParam(min_val, max_val)  # type: ignore
-        }[param_type]
-        return strategy()  # type: ignore
+        strategy = PARAM_STRATEGIES[data_type][param_type]
+        return strategy(eq, min_val, max_val)  # type: ignore
 
     def _get_param_type(self, eq, min_val, max_val) -> str:
         """Determine how the parameter should be interpreted.
@@ -1149,13 +1274,59 @@ class Query:
         Returns:
             One of the following as a string: empty, equals, range.
         """
-        if eq is None:
-            if min_val is None and max_val is None:
-                return 'empty'
-            else:
-                return 'range'
-        else:
-            if min_val is not None or max_val is not None:
-                raise RuntimeError('Both range and equality filters provided.')
-            else:
-                return 'equals'
+        given_index = (eq is not None) << 2 | (min_val is not None) << 1 | (max_val is not None)
+        param_type = PARAM_TYPES[given_index]
+
+        if param_type is None:
+            raise RuntimeError('Both range and equality filters provided.')
+
+        return param_type
+
+
+def execute_all(queries: typing.Iterable[Query],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> typing.List[afscgap.cursor.Cursor]:
+    """Execute multiple queries, returning a cursor for each.
+
+    Execute multiple queries like those for different years or surveys, looking up the matching
+    hauls for up to max_concurrency queries at the same time. Each query uses its own limit,
+    filters, and prefetch depth.
+
+    Args:
+        queries: The queries to execute.
+        max_concurrency: The maximum number of queries whose hauls are looked up at the same time.
+            If less than 2, queries are executed one after another. Defaults to
+            DEFAULT_MAX_CONCURRENCY.
+
+    Returns:
+        List of cursors in the same order as the queries provided.
+    """
+    queries_realized = list(queries)
+
+    if max_concurrency < 2 or len(queries_realized) < 2:
+        return list(map(lambda x: x.execute(), queries_realized))
+    else:
+        workers = min(max_concurrency, len(queries_realized))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda x: x.execute(), queries_realized))
+
+
+def execute_many(queries: typing.Iterable[Query],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> afscgap.cursor.Cursor:
+    """Execute multiple queries, returning a single cursor over all of their results.
+
+    Execute multiple queries through execute_all, yielding records query by query in the order
+    provided.
+
+    Args:
+        queries: The queries to execute.
+        max_concurrency: The maximum number of queries whose hauls are looked up at the same time.
+            If less than 2, queries are executed one after another. Defaults to
+            DEFAULT_MAX_CONCURRENCY.
+
+    Returns:
+        Cursor which iterates over the results of the first query, then the second, and so on.
+    """
+    # Deferred like afscgap.cursor which is only imported for type checking at module level.
+    import afscgap.flat_cursor
+
+    return afscgap.flat_cursor.ChainCursor(execute_all(queries, max_concurrency))
@@ -7,7 +7,9 @@ for Data Science and the Environment at UC Berkeley.
 This file is part of afscgap released under the BSD 3-Clause License. See
 LICENSE.md.
 """
+import itertools
 import re
+import typing
 
 from afscgap.typesdef import OPT_FLOAT
 
@@ -123,6 +125,29 @@ UNIT_TYPES = {
 }
 
 
+IDENTITY_PROBES = (1.5, 123.25)
+
+
+def is_identity_units(units: str) -> bool:
+    """Determine if values in the given units are stored without conversion.
+
+    Args:
+        units: The units to check like kg.
+
+    Returns:
+        True if both the converter and unconverter for the units return sample values unchanged and
+        false otherwise.
+    """
+    unit_type = UNIT_TYPES[units]
+    converter = CONVERTERS[unit_type][units]
+    unconverter = UNCONVERTERS[unit_type][units]
+    return all(map(lambda x: converter(x) == x and unconverter(x) == x, IDENTITY_PROBES))
+
+
+# Units in which values are stored such that their converters and unconverters are identities.
+IDENTITY_UNITS = frozenset(filter(is_identity_units, UNIT_TYPES.keys()))
+
+
 def is_iso8601(target: str) -> bool:
     """Determine if a string matches an expected ISO 8601 format.
 
@@ -135,20 +160,17 @@ def is_iso8601(target: str) -> bool:
     return ISO_8601_REGEX.match(target) is not None
 
 
-def convert(target: OPT_FLOAT, source: str, destination: str) -> OPT_FLOAT:
-    """Convert a value.
+def check_units(source: str, destination: str):
+    """Check that a value can be converted between two units.
 
     Args:
-        target: The value to convert.
         source: Original units.
         destination: Target units.
 
-    Returns:
-        The converted value. Note that, if target is None, will return None.
+    Raises:
+        RuntimeError: Raised if either units are unknown or if they describe different types of
+            measurement like converting from a distance to a weight.
     """
-    if target is None:
-        return None
-
     if source not in UNIT_TYPES:
         raise RuntimeError('Unknown units: %s' % source)
 
@@ -161,10 +183,80 @@ def convert(target: OPT_FLOAT, source: str, destination: str) -> OPT_FLOAT:
     if source_type != destination_type:
         raise RuntimeError('Cannot convert from %s to %s' % (source, destination))
 
-    source_converter = UNCONVERTERS[source_type][source]
-    destination_converter = CONVERTERS[destination_type][destination]
 
-    unconverted = source_converter(target)
-    converted = destination_converter(unconverted)
+def build_converter(source: str, destination: str) -> typing.Callable[[float], float]:
+    """Build a function which converts a value from one set of units to another.
+
+    Args:
+        source: Original units.
+        destination: Target units.
+
+    Returns:
+        Function taking a non-None value in the source units and returning it in the destination
+        units. If the units are the same, the value is returned unchanged.
+    """
+    check_units(source, destination)
+
+    if source == destination:
+        return lambda x: x
+
+    source_converter = UNCONVERTERS[UNIT_TYPES[source]][source]
+    destination_converter = CONVERTERS[UNIT_TYPES[destination]][destination]
+
+    # Avoid chaining through an identity as one side is typically the units used in storage.
+    if source in IDENTITY_UNITS:
+        return destination_converter
+    elif destination in IDENTITY_UNITS:
+        return source_converter
+    else:
+        return lambda x: destination_converter(source_converter(x))
+
+
+UNIT_PAIRS = tuple(filter(
+    lambda x: UNIT_TYPES[x[0]] == UNIT_TYPES[x[1]],
+    itertools.product(UNIT_TYPES.keys(), repeat=2)
+))
+
+CONVERTERS_BY_PAIR = dict(map(lambda x: (x, build_converter(x[0], x[1])), UNIT_PAIRS))
+
+
+def convert(target: OPT_FLOAT, source: str, destination: str) -> OPT_FLOAT:
+    """Convert a value.
+
+    Args:
+        target: The value to convert.
+        source: Original units.
+        destination: Target units.
+
+    Returns:
+        The converted value. Note that, if target is None, will return None.
+    """
+    if target is None:
+        return None
+
+    return get_converter(source, destination)(target)
+
+
+def get_converter(source: str,
+    destination: str) -> typing.Callable[[float], float]:
+    """Get the function which converts a non-None value from one set of units to another.
+
+    Args:
+        source: Original units.
+        destination: Target units.
+
+    Raises:
+        RuntimeError: Raised if either units are unknown or if they describe different kinds of
+            measurement.
+
+    Returns:
+        Function taking a non-None value in the source units and returning it in the destination
+        units.
+    """
+    converter = CONVERTERS_BY_PAIR.get((source, destination), None)
+
+    if converter is None:
+        check_units(source, destination)
+        raise RuntimeError('Cannot convert from %s to %s' % (source, destination))
 
-    return converted
+    return converter
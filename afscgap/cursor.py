@@ -8,13 +8,16 @@ This file is part of afscgap released under the BSD 3-Clause License. See
 LICENSE.md.
 """
 
-import queue
+import itertools
 import typing
 
 import afscgap.model
 
 from afscgap.typesdef import OPT_INT
 
+if typing.TYPE_CHECKING:
+    import queue
+
 
 class Cursor(typing.Iterable[afscgap.model.Record]):
     """Interface for objects allowing generation / retrieval of records."""
@@ -58,7 +61,46 @@ class Cursor(typing.Iterable[afscgap.model.Record]):
             has otherwise the same beahavior as iterating in this Cursor
             directly.
         """
-        raise NotImplementedError('Use implementor.')
+        return map(lambda x: x.to_dict(), self)
+
+    def to_batches(self, batch_size: int) -> typing.Iterator[typing.List[afscgap.model.Record]]:
+        """Create an iterator which yields Records in lists of up to a given size.
+
+        Create an iterator which yields Records in lists of up to a given size, only retrieving the
+        records for a batch as it is requested. All batches are drawn from this Cursor such that
+        paging through results does not re-run the query.
+
+        Args:
+            batch_size: The maximum number of records to include in each list. The last list may be
+                smaller.
+
+        Returns:
+            Iterator over lists of Records which has otherwise the same behavior as iterating in
+            this Cursor directly.
+        """
+        if batch_size < 1:
+            raise RuntimeError('Batch size must be at least 1.')
+
+        batches = map(lambda x: list(itertools.islice(self, batch_size)), itertools.count())
+        return itertools.takewhile(lambda x: len(x) > 0, batches)
+
+    def to_dict_batches(self, batch_size: int) -> typing.Iterator[typing.List[dict]]:
+        """Create an iterator which yields dicts in lists of up to a given size.
+
+        Create an iterator which yields dicts in lists of up to a given size, only retrieving the
+        records for a batch as it is requested. This allows for chunked ingestion into other
+        libraries like Pandas without holding the full results set in memory.
+
+        Args:
+            batch_size: The maximum number of records to include in each list. The last list may be
+                smaller.
+
+        Returns:
+            Iterator over lists of dictionaries which has otherwise the same behavior as iterating
+            in this Cursor directly.
+        """
+        batches = self.to_batches(batch_size)
+        return map(lambda batch: [x.to_dict() for x in batch], batches)
 
     def get_next(self) -> typing.Optional[afscgap.model.Record]:
         """Get the next value for this Cursor.
@@ -7,8 +7,12 @@ for Data Science and the Environment at UC Berkeley.
 This file is part of afscgap released under the BSD 3-Clause License. See
 LICENSE.md.
 """
+import concurrent.futures
 import functools
+import inspect
 import itertools
+import os
+import typing
 import warnings
 
 import afscgap.cursor
@@ -21,10 +25,12 @@ from afscgap.flat_model import HAUL_KEYS, PARAMS_DICT, RECORDS
 
 WARNING_THRESHOLD = 3000
 
-LARGE_WARNING = ' '.join([
-    'Your query may return a very large amount of records.',
+LARGE_WARNING = (
+    'Your query may return a very large amount of records. '
     'Be sure to interact with results in a memory efficient way.'
-])
+)
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 def get_hauls(params: PARAMS_DICT, meta: afscgap.flat_model.ExecuteMetaParams) -> HAUL_KEYS:
@@ -37,7 +43,8 @@ def get_hauls(params: PARAMS_DICT, meta: afscgap.flat_model.ExecuteMetaParams) -
 
     Returns:
         Iterable over matching hauls. All relevant results will be included in this iterable but it
-        may also include irrelevant results, requiring further local filtering.
+        may also include irrelevant results, requiring further local filtering. If multiple index
+        files are required, up to the prefetch depth of meta are downloaded at the same time.
     """
     presence_only = meta.get_presence_only()
 
@@ -56,12 +63,68 @@ def get_hauls(params: PARAMS_DICT, meta: afscgap.flat_model.ExecuteMetaParams) -
     if len(index_filters_realized) == 0:
         return afscgap.flat_http.get_all_hauls(meta)
 
-    haul_iterables = map(
-        lambda x: afscgap.flat_http.get_hauls_for_index_filter(meta, x),
-        index_filters_realized
+    def get_filter_tasks(filter_index: int) -> typing.Iterable[typing.Tuple[int, str]]:
+        index_filter = index_filters_realized[filter_index]
+        urls = afscgap.flat_http.get_index_urls(meta, index_filter)
+        return map(lambda x: (filter_index, x), urls)
+
+    tasks = list(itertools.chain(*map(get_filter_tasks, range(0, len(index_filters_realized)))))
+
+    def get_haul_set(task: typing.Tuple[int, str]) -> typing.Set[afscgap.flat_model.HaulKey]:
+        filter_index, url = task
+        index_filter = index_filters_realized[filter_index]
+        return set(afscgap.flat_http.get_hauls_for_index_url(meta, index_filter, url))
+
+    num_workers = min(meta.get_prefetch_depth(), len(tasks))
+    if num_workers < 2:
+        url_haul_sets = list(map(get_haul_set, tasks))
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+            url_haul_sets = list(executor.map(get_haul_set, tasks))
+
+    # A haul may match any index of a filter (or) but must match every filter (and).
+    haul_sets: typing.List[typing.Set[afscgap.flat_model.HaulKey]] = list(
+        map(lambda x: set(), index_filters_realized)
     )
-    haul_sets = map(lambda x: set(x), haul_iterables)
-    return functools.reduce(lambda a, b: a.intersection(b), haul_sets)  # type: ignore
+    for task, url_haul_set in zip(tasks, url_haul_sets):
+        haul_sets[task[0]].update(url_haul_set)
+
+    return functools.reduce(lambda a, b: a.intersection(b), haul_sets)
+
+
+def get_required_params(params: PARAMS_DICT) -> PARAMS_DICT:
+    """Get the parameters which actually constrain results.
+
+    Args:
+        params: Set of parameters which may include those which can be ignored like empty params.
+
+    Returns:
+        New mapping with only the parameters which are not ignorable.
+    """
+    return {field: param for field, param in params.items() if not param.get_is_ignorable()}
+
+
+def get_warning_stack_level() -> int:
+    """Determine the stack level which attributes a warning to the first caller outside afscgap.
+
+    Determine the stack level which attributes a warning to the first caller outside afscgap,
+    working regardless of if the warning was reached through Query.execute, execute_many, or
+    execute_all. Note that, for execute_all with concurrency, the first frame outside afscgap is
+    within the thread pool.
+
+    Returns:
+        Stack level to use for warnings.warn when called from the function calling this one.
+    """
+    frame = inspect.currentframe()
+    caller = frame.f_back if frame is not None else None
+    del frame
+
+    level = 1
+    while caller is not None and os.path.dirname(caller.f_code.co_filename) == PACKAGE_DIR:
+        caller = caller.f_back
+        level += 1
+
+    return level
 
 
 def check_warning(hauls: HAUL_KEYS, meta: afscgap.flat_model.ExecuteMetaParams):
@@ -77,12 +140,16 @@ def check_warning(hauls: HAUL_KEYS, meta: afscgap.flat_model.ExecuteMetaParams):
     if meta.get_suppress_large_warning():
         return
 
-    num_hauls = sum(map(lambda x: 1, hauls))
+    # Only need to know if the threshold is exceeded, not the full count.
+    hauls_capped = itertools.islice(hauls, WARNING_THRESHOLD + 1)
+    num_hauls = sum(map(lambda x: 1, hauls_capped))
 
     if num_hauls > WARNING_THRESHOLD:
         warn_func = meta.get_warn_func()
-        warn_func_realized = warnings.warn if warn_func is None else warn_func
-        warn_func_realized(LARGE_WARNING)  # type: ignore
+        if warn_func is None:
+            warnings.warn(LARGE_WARNING, stacklevel=get_warning_stack_level())
+        else:
+            warn_func(LARGE_WARNING)
 
 
 def execute(param_dict: PARAMS_DICT,
@@ -96,20 +163,22 @@ def execute(param_dict: PARAMS_DICT,
     Returns:
         Iterable over matching results.
     """
-    local_filter = afscgap.flat_local_filter.build_filter(param_dict)
-    hauls = get_hauls(param_dict, meta)
+    params_required = get_required_params(param_dict)
+    hauls = get_hauls(params_required, meta)
 
     hauls_realized = list(hauls)
     check_warning(hauls_realized, meta)
 
-    candidate_records_nested = map(
-        lambda x: afscgap.flat_http.get_records_for_haul(meta, x),
-        hauls_realized
-    )
-    candidate_records: RECORDS = itertools.chain(*candidate_records_nested)
-    records: RECORDS = filter(lambda x: local_filter.matches(x), candidate_records)
+    candidate_records = afscgap.flat_http.get_records_for_hauls(meta, hauls_realized)
+
+    # Avoid a per-record filter call if there is nothing to filter on.
+    records: RECORDS
+    if len(params_required) == 0:
+        records = candidate_records
+    else:
+        local_filter = afscgap.flat_local_filter.build_filter(params_required)
+        records = filter(local_filter.matches, candidate_records)
 
-    limit = meta.get_limit()
     raw_cursor = afscgap.flat_cursor.FlatCursor(records)
 
     no_incomplete = meta.get_filter_incomplete()
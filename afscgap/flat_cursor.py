@@ -66,16 +66,6 @@ class FlatCursor(afscgap.cursor.Cursor):
         """
         return queue.Queue()
 
-    def to_dicts(self) -> typing.Iterable[dict]:
-        """Create an iterator which converts Records to dicts.
-
-        Returns:
-            Iterator which returns dictionaries instead of Record objects but
-            has otherwise the same beahavior as iterating in this Cursor
-            directly.
-        """
-        return map(lambda x: x.to_dict(), self)
-
     def get_next(self) -> typing.Optional[afscgap.model.Record]:
         """Get the next value for this Cursor.
 
@@ -121,15 +111,17 @@ class CompleteCursor(afscgap.cursor.Cursor):
         """
         return True
 
-    def to_dicts(self) -> typing.Iterable[dict]:
-        """Create an iterator which converts Records to dicts.
+    def get_invalid(self) -> 'queue.Queue[dict]':
+        """Get a queue of invalid / incomplete records found so far.
 
         Returns:
-            Iterator which returns dictionaries instead of Record objects but
-            has otherwise the same beahavior as iterating in this Cursor
-            directly.
+            Queue with dictionaries containing the raw data returned from the
+            remote that did not have valid values for all required fields. Note
+            that this will include incomplete records as well if
+            get_filtering_incomplete() is true and will not contain incomplete
+            records otherwise.
         """
-        return map(lambda x: x.to_dict(), self)
+        return self._invalid
 
     def get_next(self) -> typing.Optional[afscgap.model.Record]:
         """Get the next value for this Cursor.
@@ -196,15 +188,17 @@ class LimitCursor(afscgap.cursor.Cursor):
         """
         return self._inner.get_filtering_incomplete()
 
-    def to_dicts(self) -> typing.Iterable[dict]:
-        """Create an iterator which converts Records to dicts.
+    def get_invalid(self) -> 'queue.Queue[dict]':
+        """Get a queue of invalid / incomplete records found so far.
 
         Returns:
-            Iterator which returns dictionaries instead of Record objects but
-            has otherwise the same beahavior as iterating in this Cursor
-            directly.
+            Queue with dictionaries containing the raw data returned from the
+            remote that did not have valid values for all required fields. Note
+            that this will include incomplete records as well if
+            get_filtering_incomplete() is true and will not contain incomplete
+            records otherwise.
         """
-        return map(lambda x: x.to_dict(), self)
+        return self._inner.get_invalid()
 
     def get_next(self) -> typing.Optional[afscgap.model.Record]:
         """Get the next value for this Cursor.
@@ -224,3 +218,78 @@ class LimitCursor(afscgap.cursor.Cursor):
         else:
             self._remaining -= 1
             return next_candidate
+
+
+class ChainCursor(afscgap.cursor.Cursor):
+    """Cursor which yields all records from each of a series of other cursors in turn."""
+
+    def __init__(self, inners: typing.Sequence[afscgap.cursor.Cursor]):
+        """Create a new cursor which chains together existing cursors.
+
+        Args:
+            inners: The cursors to iterate over in order, exhausting each before moving to the next.
+        """
+        self._inners = inners
+        self._inners_iter = iter(self._inners)
+        self._current: typing.Optional[afscgap.cursor.Cursor] = next(self._inners_iter, None)
+        self._invalid: queue.Queue[dict] = queue.Queue()
+
+    def get_limit(self) -> OPT_INT:
+        """Get the overall limit.
+
+        Returns:
+            The maximum number of records to return. Always None as limits are applied by the inner
+            cursors individually.
+        """
+        return None
+
+    def get_filtering_incomplete(self) -> bool:
+        """Determine if this cursor is silently filtering incomplete records.
+
+        Returns:
+            Flag indicating if incomplete records should be silently filtered.
+            If true, they will not be returned during iteration and placed in
+            the queue at get_invalid(). If false, they will be returned and
+            those incomplete records' get_complete() will return false. True
+            only if all inner cursors filter incomplete records.
+        """
+        return all(map(lambda x: x.get_filtering_incomplete(), self._inners))
+
+    def get_invalid(self) -> 'queue.Queue[dict]':
+        """Get a queue of invalid / incomplete records found so far.
+
+        Get a queue of invalid / incomplete records found so far across all inner cursors. Records
+        are moved from the queues of the inner cursors into a single queue which is returned on
+        every call.
+
+        Returns:
+            Queue with dictionaries containing the raw data returned from the
+            remote that did not have valid values for all required fields. Note
+            that this will include incomplete records as well if
+            get_filtering_incomplete() is true and will not contain incomplete
+            records otherwise.
+        """
+        for inner in self._inners:
+            inner_invalid = inner.get_invalid()
+            while not inner_invalid.empty():
+                self._invalid.put(inner_invalid.get_nowait())
+
+        return self._invalid
+
+    def get_next(self) -> typing.Optional[afscgap.model.Record]:
+        """Get the next value for this Cursor.
+
+        Returns:
+            The next value waiting if cached in the cursor's results queue or
+            as just retrieved from a new page gathered by HTTP request. Will
+            return None if no remain.
+        """
+        while self._current is not None:
+            next_candidate = self._current.get_next()
+
+            if next_candidate is not None:
+                return next_candidate
+
+            self._current = next(self._inners_iter, None)
+
+        return None
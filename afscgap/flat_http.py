@@ -10,19 +10,33 @@ for Data Science and the Environment at UC Berkeley.
 This file is part of afscgap released under the BSD 3-Clause License. See
 LICENSE.md.
 """
+import collections
+import concurrent.futures
+import io
 import itertools
 import typing
+import weakref
 
 import fastavro
+import requests
 
 import afscgap.flat_index_util
 import afscgap.flat_model
 import afscgap.http_util
+import afscgap.model
 
 from afscgap.flat_model import HAUL_KEYS, RECORDS
 from afscgap.typesdef import REQUESTOR
 
 MAIN_INDEX_PATH = '/index/main.avro'
+INDEX_PATH_TEMPLATE = '%s/index/%s.avro'
+READ_CHUNK_SIZE = 1024 * 64
+ZEROABLE_FIELDS = ['cpue_kgkm2', 'cpue_nokm2', 'weight_kg', 'count']
+INDEX_CACHE_SIZE = 16
+INDEX_CACHE_TTL = 60 * 5  # 5 minutes
+
+# Index files are reused across queries in a session. Call INDEX_CACHE.clear() to force refresh.
+INDEX_CACHE = afscgap.http_util.ResponseCache(INDEX_CACHE_SIZE, INDEX_CACHE_TTL)
 OPT_FILTER = typing.Optional[afscgap.flat_index_util.IndexFilter]
 
 
@@ -67,8 +81,8 @@ def get_index_urls(meta: afscgap.flat_model.ExecuteMetaParams,
     if index_filter is None:
         return [meta.get_base_url() + MAIN_INDEX_PATH]
     else:
-        paths = map(lambda x: '/index/%s.avro' % x, index_filter.get_index_names())
-        return map(lambda x: meta.get_base_url() + x, paths)
+        base_url = meta.get_base_url()
+        return map(lambda x: INDEX_PATH_TEMPLATE % (base_url, x), index_filter.get_index_names())
 
 
 def determine_matching_hauls_from_index(options: typing.Iterable[dict],
@@ -88,25 +102,123 @@ def determine_matching_hauls_from_index(options: typing.Iterable[dict],
     return dict_stream
 
 
-def get_complete(iterator, url: str) -> typing.List[dict]:
-    """Get the complete payload from an Avro iterator.
+def is_non_zero(target: dict) -> bool:
+    """Determine if a raw joined record describes a catch rather than an inferred zero catch.
+
+    Args:
+        target: The record as read from a flat file prior to being wrapped in a FlatRecord.
+
+    Returns:
+        True if any of ZEROABLE_FIELDS is positive and False if the record is a zero catch record.
+    """
+    def is_field_non_zero(field: str) -> bool:
+        value = target.get(field, None)
+        return (value is not None) and (value > 0)
+
+    return any(map(is_field_non_zero, ZEROABLE_FIELDS))
 
-    Get the complete payload from an Avro iterator to avoid issues with streaming interruption on
-    weaker connections.
+
+def get_avro_records(response: requests.Response, url: str) -> typing.Iterator[dict]:
+    """Get the records from an Avro payload, decoding them only as they are requested.
+
+    Get the records from an Avro payload where the complete payload is downloaded prior to decoding
+    to avoid issues with streaming interruption on weaker connections. However, records are decoded
+    from that in-memory payload lazily so that the full set of parsed records need not be held in
+    memory at the same time.
 
     Args:
-        iterator: The iterator over Avro files read from the stream.
+        response: The response whose body contains the Avro payload.
         url: The URL at which the Avro payload was found.
 
     Returns:
-        Iterable over the parsed Avro records.
+        Iterator over the parsed Avro records.
+    """
+    return decode_avro_records(read_body(response, url), url)
+
+
+def read_body(response: requests.Response, url: str) -> bytes:
+    """Read the complete body of a response.
+
+    Read the complete body of a response in chunks of READ_CHUNK_SIZE bytes rather than the smaller
+    requests default.
+
+    Args:
+        response: The response whose body should be read.
+        url: The URL at which the response was found.
+
+    Returns:
+        The body of the response.
     """
     try:
-        return list(iterator)
+        chunks = response.iter_content(chunk_size=READ_CHUNK_SIZE)
+        return b''.join(chunks)
     except Exception as e:
         raise RuntimeError('Failed on %s (%s).' % (url, str(e)))
 
 
+def decode_avro_records(body: bytes, url: str) -> typing.Iterator[dict]:
+    """Get the records from an in-memory Avro payload, decoding them only as they are requested.
+
+    Get the records from an in-memory Avro payload where the header is read immediately and records
+    are decoded as iterated. Decoding errors are raised as RuntimeErrors including the URL.
+
+    Args:
+        body: The Avro payload.
+        url: The URL at which the Avro payload was found.
+
+    Returns:
+        Iterator over the parsed Avro records.
+    """
+    try:
+        reader = fastavro.reader(io.BytesIO(body))
+    except Exception as e:
+        raise RuntimeError('Failed on %s (%s).' % (url, str(e)))
+
+    # Blocks after the header are only decoded during iteration so must be wrapped there as well.
+    def iterate_records() -> typing.Iterator[dict]:
+        try:
+            yield from reader  # type: ignore
+        except Exception as e:
+            raise RuntimeError('Failed on %s (%s).' % (url, str(e)))
+
+    return iterate_records()
+
+
+def get_index_records(meta: afscgap.flat_model.ExecuteMetaParams,
+    url: str) -> typing.Iterator[dict]:
+    """Get the records from a precomputed index file, reusing a recent download if available.
+
+    Get the records from a precomputed index file. If using the default requestor, index files
+    downloaded within the last INDEX_CACHE_TTL seconds are reused from INDEX_CACHE. Custom
+    requestors are always called.
+
+    Args:
+        meta: Configuration object which indicates how the index should be requested. This can, for
+            example, be used to configure the server from which data are streamed.
+        url: The URL at which the index file can be found.
+
+    Returns:
+        Iterator over the parsed Avro records in the index file.
+    """
+    requestor_maybe = meta.get_requestor()
+    use_cache = requestor_maybe is None
+
+    body = INDEX_CACHE.get(url) if use_cache else None
+
+    if body is None:
+        requestor = requestor_maybe if requestor_maybe else build_requestor()
+        response = requestor(url)
+
+        afscgap.http_util.check_result(response)
+
+        body = read_body(response, url)
+
+        if use_cache:
+            INDEX_CACHE.put(url, body)
+
+    return decode_avro_records(body, url)
+
+
 def get_all_hauls(meta: afscgap.flat_model.ExecuteMetaParams) -> HAUL_KEYS:
     """Get information about all hauls currently available.
 
@@ -121,50 +233,29 @@ def get_all_hauls(meta: afscgap.flat_model.ExecuteMetaParams) -> HAUL_KEYS:
     assert len(urls) == 1
     url = urls[0]
 
-    requestor_maybe = meta.get_requestor()
-    requestor = requestor_maybe if requestor_maybe else build_requestor()
-    response = requestor(url)
-
-    afscgap.http_util.check_result(response)
-
-    stream = response.raw
-    dict_stream = get_complete(fastavro.reader(stream), url)  # type: ignore
-    obj_stream = map(build_haul_from_avro, dict_stream)  # type: ignore
+    dict_stream = get_index_records(meta, url)
+    obj_stream = map(build_haul_from_avro, dict_stream)
     return obj_stream
 
 
-def get_hauls_for_index_filter(meta: afscgap.flat_model.ExecuteMetaParams,
-    index_filter: afscgap.flat_index_util.IndexFilter) -> HAUL_KEYS:
-    """Get hauls which may match a filter using precomputed indicies.
-
-    Get all hauls which may match a filter using pre-computed Avro haul indicies which may prevent
-    the query from requiring all catch data to be downloaded.
+def get_hauls_for_index_url(meta: afscgap.flat_model.ExecuteMetaParams,
+    index_filter: afscgap.flat_index_util.IndexFilter, url: str) -> HAUL_KEYS:
+    """Get hauls which may match a filter using a single precomputed index file.
 
     Args:
         meta: Configuration object which indicates how the all hauls index should be requested. This
             can, for example, be used to configure the server from which data are streamed.
         index_filter: Information about the filter to be applied against a precomputed index.
+        url: The URL of one of the index files used by index_filter as returned by get_index_urls.
 
     Returns:
-        Iterable over haul keys which may match the specified filter.
+        Iterable over haul keys in the index file at url which may match the specified filter.
     """
-    urls = get_index_urls(meta, index_filter)
-
-    def get_for_url(url):
-        requestor_maybe = meta.get_requestor()
-        requestor = requestor_maybe if requestor_maybe else build_requestor()
-        response = requestor(url)
-
-        afscgap.http_util.check_result(response)
-
-        stream = response.raw
-        all_with_value = get_complete(fastavro.reader(stream), url)
-        dict_stream = determine_matching_hauls_from_index(all_with_value, index_filter)
+    all_with_value = get_index_records(meta, url)
+    dict_stream = determine_matching_hauls_from_index(all_with_value, index_filter)
 
-        obj_stream = map(build_haul_from_avro, dict_stream)
-        return obj_stream
-
-    return itertools.chain(*map(get_for_url, urls))
+    obj_stream = map(build_haul_from_avro, dict_stream)
+    return obj_stream
 
 
 def get_records_for_haul(meta: afscgap.flat_model.ExecuteMetaParams,
@@ -177,7 +268,8 @@ def get_records_for_haul(meta: afscgap.flat_model.ExecuteMetaParams,
         haul: The haul for which records should be returned.
 
     Returns:
-        All joined records for the given haul.
+        All joined records for the given haul. If meta indicates presence only, zero catch records
+        are excluded prior to being wrapped as FlatRecords.
     """
     path = haul.get_path()
     url = meta.get_base_url() + path
@@ -188,7 +280,79 @@ def get_records_for_haul(meta: afscgap.flat_model.ExecuteMetaParams,
 
     afscgap.http_util.check_result(response)
 
-    stream = response.raw
-    dict_stream = get_complete(fastavro.reader(stream), url)
+    dict_stream = get_avro_records(response, url)
+
+    if meta.get_presence_only():
+        dict_stream = filter(is_non_zero, dict_stream)
+
     obj_stream = map(lambda x: afscgap.flat_model.FlatRecord(x), dict_stream)
     return obj_stream
+
+
+def stop_prefetch(executor: concurrent.futures.ThreadPoolExecutor,
+    pending: typing.Deque[concurrent.futures.Future]):
+    """Cancel haul downloads which have not yet started and release the prefetch worker threads.
+
+    Args:
+        executor: The executor running the haul downloads.
+        pending: The futures for downloads whose records have not yet been iterated.
+    """
+    for future in pending:
+        future.cancel()
+
+    executor.shutdown(wait=False)
+
+
+def get_records_for_hauls(meta: afscgap.flat_model.ExecuteMetaParams,
+    hauls: HAUL_KEYS) -> RECORDS:
+    """Get the joined records from multiple hauls, downloading several hauls at a time.
+
+    Get the joined records from multiple hauls where the flat files for upcoming hauls are requested
+    in background threads while records from the current haul are being iterated. This overlaps
+    network latency across requests while keeping the records in the same order as hauls. The number
+    of hauls requested ahead of the consumer is controlled by the prefetch depth of meta and the
+    first of those requests are started before this function returns. Requests not yet started are
+    cancelled once iteration finishes or the returned iterator is garbage collected.
+
+    Args:
+        meta: Configuration object which indicates how the all hauls index should be requested. This
+            can, for example, be used to configure the server from which data are streamed.
+        hauls: The hauls for which records should be returned.
+
+    Returns:
+        All joined records for the given hauls in haul order.
+    """
+    prefetch_depth = meta.get_prefetch_depth()
+    if prefetch_depth < 1:
+        return itertools.chain.from_iterable(
+            map(lambda x: get_records_for_haul(meta, x), hauls)
+        )
+
+    hauls_iter = iter(hauls)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=prefetch_depth)
+    pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+
+    def submit_next():
+        haul = next(hauls_iter, None)
+        if haul is not None:
+            pending.append(executor.submit(get_records_for_haul, meta, haul))
+
+    def iterate_records() -> typing.Iterator[afscgap.model.Record]:
+        try:
+            while len(pending) > 0:
+                future = pending.popleft()
+                submit_next()
+                yield from future.result()
+        finally:
+            stop_prefetch(executor, pending)
+
+    # Start on the first hauls right away so that they download before iteration begins.
+    for i in range(0, prefetch_depth):
+        submit_next()
+
+    records = iterate_records()
+
+    # The finally above only runs if iteration started so also stop when records are dropped.
+    weakref.finalize(records, stop_prefetch, executor, pending)
+
+    return records
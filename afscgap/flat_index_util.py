@@ -20,6 +20,46 @@ import afscgap.param
 MATCH_TARGET = typing.Union[float, int, str, None]
 STRS = typing.Iterable[str]
 
+DATE_PREFIX_CACHE_SIZE = 4096
+FLOAT_INDEX_PRECISION = 2
+
+
+def get_float_rounded(target: MATCH_TARGET) -> typing.Optional[float]:
+    """Get a float which matches the approximation / rounding used in the precomputed indicies.
+
+    Get a float which matches the approximation / rounding used in the precomputed indicies, which
+    store values rounded to FLOAT_INDEX_PRECISION decimal places. Comparisons are made on these
+    numbers rather than on their string representations so that, for example, 9.5 is found to be
+    less than 10.
+
+    Args:
+        target: The value to be converted to the index approximation / rounding. This may be a
+            number or a string as found in the precomputed index.
+
+    Returns:
+        The rounded value or None if target is None.
+    """
+    if target is None:
+        return None
+    else:
+        return round(float(target), FLOAT_INDEX_PRECISION)
+
+
+@functools.lru_cache(maxsize=DATE_PREFIX_CACHE_SIZE)
+def get_date_prefix(target: str) -> str:
+    """Get the date portion of an ISO 8601 datetime string as used in the precomputed indicies.
+
+    Get the date portion of an ISO 8601 datetime string, memoized as the same dates are seen many
+    times while scanning a precomputed index.
+
+    Args:
+        target: The ISO 8601 string from which the date should be extracted.
+
+    Returns:
+        The portion of the string prior to the time component.
+    """
+    return target.split('T')[0]
+
 
 class IndexFilter:
     """Interface for a filter against a precomupted index."""
@@ -61,12 +101,13 @@ class StringEqIndexFilter(IndexFilter):
         """
         self._index_name = index_name
         self._param = param
+        self._value = param.get_value()
 
     def get_index_names(self) -> STRS:
         return [self._index_name]
 
     def get_matches(self, value) -> bool:
-        return value is not None and value == self._param.get_value()
+        return value is not None and value == self._value
 
 
 class StringRangeIndexFilter(IndexFilter):
@@ -81,6 +122,8 @@ class StringRangeIndexFilter(IndexFilter):
         """
         self._index_name = index_name
         self._param = param
+        self._low = param.get_low()
+        self._high = param.get_high()
 
     def get_index_names(self) -> STRS:
         return [self._index_name]
@@ -89,13 +132,13 @@ class StringRangeIndexFilter(IndexFilter):
         if value is None:
             return False
 
-        if self._param.get_low() is not None:
-            satisfies_low = value >= self._param.get_low()
+        if self._low is not None:
+            satisfies_low = value >= self._low
         else:
             satisfies_low = True
 
-        if self._param.get_high() is not None:
-            satisfies_high = value <= self._param.get_high()
+        if self._high is not None:
+            satisfies_high = value <= self._high
         else:
             satisfies_high = True
 
@@ -114,12 +157,13 @@ class IntEqIndexFilter(IndexFilter):
         """
         self._index_name = index_name
         self._param = param
+        self._value = param.get_value()
 
     def get_index_names(self) -> STRS:
         return [self._index_name]
 
     def get_matches(self, value) -> bool:
-        return value is not None and value == self._param.get_value()
+        return value is not None and value == self._value
 
 
 class IntRangeIndexFilter(IndexFilter):
@@ -134,6 +178,8 @@ class IntRangeIndexFilter(IndexFilter):
         """
         self._index_name = index_name
         self._param = param
+        self._low = param.get_low()
+        self._high = param.get_high()
 
     def get_index_names(self) -> STRS:
         return [self._index_name]
@@ -142,13 +188,13 @@ class IntRangeIndexFilter(IndexFilter):
         if value is None:
             return False
 
-        if self._param.get_low() is not None:
-            satisfies_low = value >= self._param.get_low()
+        if self._low is not None:
+            satisfies_low = value >= self._low
         else:
             satisfies_low = True
 
-        if self._param.get_high() is not None:
-            satisfies_high = value <= self._param.get_high()
+        if self._high is not None:
+            satisfies_high = value <= self._high
         else:
             satisfies_high = True
 
@@ -167,24 +213,18 @@ class FloatEqIndexFilter(IndexFilter):
         """
         self._index_name = index_name
         self._param = param
-        self._param_str = self._prep_string(self._param.get_value())
+        self._param_rounded = get_float_rounded(self._param.get_value())
 
     def get_index_names(self) -> STRS:
         return [self._index_name]
 
     def get_matches(self, target: MATCH_TARGET) -> bool:
-        value = self._prep_string(target)
+        value = get_float_rounded(target)
 
         if value is None:
             return False
         else:
-            return value == self._param_str
-
-    def _prep_string(self, target) -> typing.Optional[str]:
-        if target is None:
-            return None
-        else:
-            return '%.2f' % target  # type: ignore
+            return value == self._param_rounded
 
 
 class FloatRangeIndexFilter(IndexFilter):
@@ -203,45 +243,30 @@ class FloatRangeIndexFilter(IndexFilter):
         """
         self._index_name = index_name
         self._param = param
-        self._low_str = self._prep_string(self._param.get_low())
-        self._high_str = self._prep_string(self._param.get_high())
+        self._low_rounded = get_float_rounded(self._param.get_low())
+        self._high_rounded = get_float_rounded(self._param.get_high())
 
     def get_index_names(self) -> STRS:
         return [self._index_name]
 
     def get_matches(self, target: MATCH_TARGET) -> bool:
-        value = self._prep_string(target)
+        value = get_float_rounded(target)
 
         if value is None:
             return False
 
-        if self._low_str is not None:
-            satisfies_low = value >= self._low_str
+        if self._low_rounded is not None:
+            satisfies_low = value >= self._low_rounded
         else:
             satisfies_low = True
 
-        if self._high_str is not None:
-            satisfies_high = value <= self._high_str
+        if self._high_rounded is not None:
+            satisfies_high = value <= self._high_rounded
         else:
             satisfies_high = True
 
         return satisfies_low and satisfies_high
 
-    def _prep_string(self, target) -> typing.Optional[str]:
-        """Get a string which matches approximation / rounding used in the precomputed index.
-
-        Args:
-            target: The value to be converted to the index approximation / rounding.
-
-        Returns:
-            String describing the approximation / rounding of the input value which would be found
-            in the precomputed index.
-        """
-        if target is None:
-            return None
-        else:
-            return '%.2f' % target  # type: ignore
-
 
 class DatetimeEqIndexFilter(IndexFilter):
     """Precomputed index filter that checks for approximate datetime equality."""
@@ -281,7 +306,7 @@ class DatetimeEqIndexFilter(IndexFilter):
         if target is None:
             return None
         else:
-            return target.split('T')[0]  # type: ignore
+            return get_date_prefix(target)  # type: ignore
 
 
 class DatetimeRangeIndexFilter(IndexFilter):
@@ -337,7 +362,7 @@ class DatetimeRangeIndexFilter(IndexFilter):
         if target is None:
             return None
         else:
-            return target.split('T')[0]  # type: ignore
+            return get_date_prefix(target)  # type: ignore
 
 
 class UnitConversionIndexFilter(IndexFilter):
@@ -392,7 +417,7 @@ class LogicalOrIndexFilter(IndexFilter):
 
     def get_matches(self, value: MATCH_TARGET) -> bool:
         matches = map(lambda x: x.get_matches(value), self._inners)
-        return functools.reduce(lambda a, b: a or b, matches)
+        return any(matches)
 
 
 STRATEGIES = {
@@ -552,4 +577,9 @@ def make_filters(field: str, param: afscgap.param.Param,
     undecorated_filters = map(lambda x: init_strategy(x, param), indicies)
     decorated_filters = map(lambda x: decorate_filter(field, x), undecorated_filters)
     decorated_filters_realized = list(decorated_filters)
-    return [LogicalOrIndexFilter(decorated_filters_realized)]
+
+    # Avoid the composite filter per index record if the field has only a single index.
+    if len(decorated_filters_realized) == 1:
+        return decorated_filters_realized
+    else:
+        return [LogicalOrIndexFilter(decorated_filters_realized)]
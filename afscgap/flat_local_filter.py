@@ -10,7 +10,6 @@ for Data Science and the Environment at UC Berkeley.
 This file is part of afscgap released under the BSD 3-Clause License. See
 LICENSE.md.
 """
-import functools
 import typing
 
 import afscgap.flat_model
@@ -100,11 +99,17 @@ class LogicalAndLocalFilter(LocalFilter):
         Args:
             inner_filters: The filter to place into a logical and relationship.
         """
-        self._inner_filters = inner_filters
+        self._inner_filters = list(inner_filters)
+
+        # Bound once here as matches runs for every downloaded record.
+        self._inner_matchers = [x.matches for x in self._inner_filters]
 
     def matches(self, target: afscgap.model.Record) -> bool:
-        individual_values = map(lambda x: x.matches(target), self._inner_filters)
-        return functools.reduce(lambda a, b: a and b, individual_values, True)
+        for matcher in self._inner_matchers:
+            if not matcher(target):
+                return False
+
+        return True
 
 
 ACCESSORS = {
@@ -157,7 +162,8 @@ def build_filter(params: PARAMS_DICT) -> LocalFilter:
         params: The parameters dictionary for which to build a local filter.
 
     Returns:
-        New filter which implements the given parameters into a local filter.
+        New filter which implements the given parameters into a local filter. If only a single
+        field is filtered, this will be the filter for that field.
     """
     params_flat = params.items()
     params_keyed = map(lambda x: afscgap.param.FieldParam(x[0], x[1]), params_flat)
@@ -171,7 +177,12 @@ def build_filter(params: PARAMS_DICT) -> LocalFilter:
     )
     individual_filters = filter(lambda x: x is not None, individual_filters_maybe)
     individual_filters_realized = list(individual_filters)
-    return LogicalAndLocalFilter(individual_filters_realized)  # type: ignore
+
+    # Avoid the composite filter per record if only a single field is filtered.
+    if len(individual_filters_realized) == 1:
+        return individual_filters_realized[0]  # type: ignore
+    else:
+        return LogicalAndLocalFilter(individual_filters_realized)  # type: ignore
 
 
 def build_individual_filter(field: str, param: afscgap.param.Param) -> typing.Optional[LocalFilter]:
@@ -18,10 +18,12 @@ from afscgap.typesdef import OPT_REQUESTOR
 from afscgap.typesdef import OPT_INT
 from afscgap.typesdef import OPT_STR
 
-PARAMS_DICT = typing.Dict[str, afscgap.param.Param]
+PARAMS_DICT = typing.Mapping[str, afscgap.param.Param]
 RECORDS = typing.Iterable[afscgap.model.Record]
 WARN_FUNCTION = typing.Optional[typing.Callable[[str], None]]
 
+DEFAULT_PREFETCH_DEPTH = 4
+
 RECORD_REQUIRED_FIELDS = [
     'area_swept_km2',
     'bottom_temperature_c',
@@ -67,7 +69,7 @@ class ExecuteMetaParams:
 
     def __init__(self, base_url: str, requestor: OPT_REQUESTOR, limit: OPT_INT,
         filter_incomplete: bool, presence_only: bool, suppress_large_warning: bool,
-        warn_func: WARN_FUNCTION):
+        warn_func: WARN_FUNCTION, prefetch_depth: int = DEFAULT_PREFETCH_DEPTH):
         """Create a new set of configuration values.
 
         Args:
@@ -84,6 +86,9 @@ class ExecuteMetaParams:
                 False if the user should be warned about downloading a very large dataset or True
                 otherwise.
             warn_func: Function to call with a string to emit a warning.
+            prefetch_depth: The maximum number of flat files to request ahead of the records
+                currently being iterated. If zero, files are requested one at a time only when
+                needed. Defaults to DEFAULT_PREFETCH_DEPTH.
         """
         self._base_url = base_url
         self._requestor = requestor
@@ -92,6 +97,7 @@ class ExecuteMetaParams:
         self._presence_only = presence_only
         self._suppress_large_warning = suppress_large_warning
         self._warn_func = warn_func
+        self._prefetch_depth = prefetch_depth
 
     def get_base_url(self) -> str:
         """Get the URL at which prejoined flat files can be found.
@@ -153,6 +159,15 @@ class ExecuteMetaParams:
         """
         return self._warn_func
 
+    def get_prefetch_depth(self) -> int:
+        """Get how many flat files may be requested ahead of iteration.
+
+        Returns:
+            The maximum number of flat files to request ahead of the records currently being
+            iterated. If zero, files are requested one at a time only when needed.
+        """
+        return self._prefetch_depth
+
 
 class HaulKey:
     """Record describing the key for a flat file haul.
@@ -161,6 +176,8 @@ class HaulKey:
     to sets of records from a haul (catches) prior to retrieving the collection in its entirety.
     """
 
+    __slots__ = ('_year', '_survey', '_haul')
+
     def __init__(self, year: int, survey: str, haul: int):
         """Create a new haul key record.
 
@@ -217,14 +234,16 @@ class HaulKey:
         return '/joined/%s.avro' % self.get_key()
 
     def __hash__(self):
-        return hash(self.__repr__())
+        # Compare on fields rather than get_key to avoid formatting a string per set operation.
+        return hash((self._year, self._survey, self._haul))
 
     def __repr__(self):
         return self.get_key()
 
     def __eq__(self, other):
         if isinstance(other, HaulKey):
-            return self.get_key() == other.get_key()
+            return (self._year, self._survey, self._haul) == \
+                (other._year, other._survey, other._haul)
         else:
             return False
 
@@ -238,6 +257,8 @@ HAUL_KEYS = typing.Iterable[HaulKey]
 class FlatRecord(afscgap.model.Record):
     """Object describing the contents of a pre-joined flat Avro file."""
 
+    __slots__ = ('_inner',)
+
     def __init__(self, inner):
         """Create a new object decorating a raw parsed Avro record.
 
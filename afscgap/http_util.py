@@ -7,11 +7,22 @@ for Data Science and the Environment at UC Berkeley.
 This file is part of afscgap released under the BSD 3-Clause License. See
 LICENSE.md.
 """
+import collections
+import threading
+import time
+import typing
+
 import requests
+import requests.adapters
+import urllib3.util.retry
 
 from afscgap.typesdef import REQUESTOR
 
 TIMEOUT = 60 * 5  # 5 minutes
+POOL_SIZE = 8
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = [429, 500, 502, 503, 504]
 
 
 def check_result(target: requests.Response):
@@ -33,10 +44,114 @@ def check_result(target: requests.Response):
         raise RuntimeError(message)
 
 
+def build_session() -> requests.Session:
+    """Build a session which keeps connections open for reuse across requests.
+
+    Returns:
+        Newly built session with a connection pool of POOL_SIZE connections shared by concurrent
+        flat file requests which retries transient failures up to MAX_RETRIES times with
+        exponential backoff.
+    """
+    session = requests.Session()
+
+    # Leave the final failed response to check_result rather than raising from within requests.
+    retry = urllib3.util.retry.Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False
+    )
+
+    # Block when all POOL_SIZE connections are in use rather than opening extra connections which
+    # would be discarded after use, as concurrency is set by prefetch depth and queries in parallel.
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=retry,
+        pool_block=True
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+SESSION = build_session()
+
+
 def build_requestor(stream: bool = False) -> REQUESTOR:
     """Build a requestor strategy that uses the requests library.
 
+    Build a requestor strategy that uses the requests library through a session shared across
+    requestors such that connections (and their TLS handshakes) are reused between requests.
+
+    Args:
+        stream: Flag indicating if the response body should be streamed. Defaults to False.
+
     Returns:
         Newly built strategy.
     """
-    return lambda x: requests.get(x, timeout=TIMEOUT, stream=stream)
+    return lambda x: SESSION.get(x, timeout=TIMEOUT, stream=stream)
+
+
+class ResponseCache:
+    """Thread-safe in-memory cache of response bodies by URL which expire after a time to live.
+
+    Thread-safe in-memory cache of response bodies by URL, evicting the least recently used body
+    once more than a maximum number of entries are held and ignoring bodies older than a time to
+    live.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        """Create a new empty cache.
+
+        Args:
+            max_entries: The maximum number of response bodies to hold at a time.
+            ttl: The number of seconds after which a cached body is no longer used.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: 'collections.OrderedDict[str, typing.Tuple[float, bytes]]' = \
+            collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> typing.Optional[bytes]:
+        """Get a cached response body.
+
+        Args:
+            url: The URL from which the body was retrieved.
+
+        Returns:
+            The cached body or None if not cached or if the cached body has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(url, None)
+
+            if entry is None:
+                return None
+
+            timestamp, body = entry
+            if time.monotonic() - timestamp > self._ttl:
+                del self._entries[url]
+                return None
+
+            self._entries.move_to_end(url)
+            return body
+
+    def put(self, url: str, body: bytes):
+        """Cache a response body, evicting the least recently used body if the cache is full.
+
+        Args:
+            url: The URL from which the body was retrieved.
+            body: The body to cache.
+        """
+        with self._lock:
+            self._entries[url] = (time.monotonic(), body)
+            self._entries.move_to_end(url)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached response bodies."""
+        with self._lock:
+            self._entries.clear()
@@ -22,6 +22,8 @@ class Record:
     not observed in a haul.
     """
 
+    __slots__ = ()
+
     def get_year(self) -> float:
         """Get the field labeled as year in the API.
 
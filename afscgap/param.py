@@ -15,6 +15,8 @@ from afscgap.typesdef import OPT_STR
 class Param:
     """Interface for a backend-agnotic parameter."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create a new parameter."""
         raise NotImplementedError('Use implementor.')
@@ -47,6 +49,8 @@ class Param:
 class FieldParam:
     """Parameter which operates on a specific field."""
 
+    __slots__ = ('_field', '_param')
+
     def __init__(self, field: str, param: Param):
         """Create a new field-specific parameter."""
         self._field = field
@@ -72,6 +76,8 @@ class FieldParam:
 class EmptyParam(Param):
     """Parameter indicating that all records should be included."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create a parameter which matches all records."""
         pass
@@ -89,6 +95,8 @@ class EmptyParam(Param):
 class StrEqualsParam(Param):
     """Parameter which requires a field to have a specific string value."""
 
+    __slots__ = ('_value',)
+
     def __init__(self, value: str):
         """Create a new string equals parameter.
 
@@ -119,6 +127,8 @@ class StrEqualsParam(Param):
 class StrRangeParam(Param):
     """Parameter which requires a field to fall within an alphanumeric range."""
 
+    __slots__ = ('_low', '_high')
+
     def __init__(self, low: OPT_STR, high: OPT_STR):
         """Create a new string range parameter.
 
@@ -162,6 +172,8 @@ class StrRangeParam(Param):
 class IntEqualsParam(Param):
     """Parameter which requires a field to have a specific integer value."""
 
+    __slots__ = ('_value',)
+
     def __init__(self, value: int):
         """Create a new int equals parameter.
 
@@ -192,6 +204,8 @@ class IntEqualsParam(Param):
 class IntRangeParam(Param):
     """Parameter which requires a field to fall within an range defined by up to two integers."""
 
+    __slots__ = ('_low', '_high')
+
     def __init__(self, low: OPT_INT, high: OPT_INT):
         """Create a new integer range parameter.
 
@@ -235,6 +249,8 @@ class IntRangeParam(Param):
 class FloatEqualsParam(Param):
     """Parameter which requires a field to have a specific floating point value."""
 
+    __slots__ = ('_value',)
+
     def __init__(self, value: float):
         """Create a new float equals parameter.
 
@@ -265,6 +281,8 @@ class FloatEqualsParam(Param):
 class FloatRangeParam(Param):
     """Parameter which requires a field to fall within an range defined by up to two floats."""
 
+    __slots__ = ('_low', '_high')
+
     def __init__(self, low: OPT_FLOAT, high: OPT_FLOAT):
         """Create a new float range parameter.
 
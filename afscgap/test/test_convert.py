@@ -96,3 +96,47 @@ class ConvertTests(unittest.TestCase):
             afscgap.convert.convert(12, 'g', 'kg'),
             0.012
         )
+
+    def test_convert_same_units(self):
+        self.assertEqual(afscgap.convert.convert(1.23, 'kg/ha', 'kg/ha'), 1.23)
+
+    def test_convert_none(self):
+        self.assertIsNone(afscgap.convert.convert(None, 'kg', 'g'))
+
+    def test_convert_unknown_units(self):
+        with self.assertRaises(RuntimeError):
+            afscgap.convert.convert(1, 'kg', 'other')
+
+    def test_convert_incompatible_units(self):
+        with self.assertRaises(RuntimeError):
+            afscgap.convert.convert(1, 'kg', 'km')
+
+    def test_get_converter(self):
+        converter = afscgap.convert.get_converter('g', 'kg')
+        self.assertAlmostEqual(converter(1000), 1)
+
+    def test_get_converter_incompatible_units(self):
+        with self.assertRaises(RuntimeError):
+            afscgap.convert.get_converter('kg', 'm')
+
+    def test_identity_units(self):
+        for units in afscgap.convert.IDENTITY_UNITS:
+            unit_type = afscgap.convert.UNIT_TYPES[units]
+            self.assertEqual(afscgap.convert.CONVERTERS[unit_type][units](2.5), 2.5)
+            self.assertEqual(afscgap.convert.UNCONVERTERS[unit_type][units](2.5), 2.5)
+
+    def test_identity_units_derived(self):
+        expected = {'ha', 'm', 'c', 'hr', 'kg', 'dd', 'kg/km2', 'no/km2', 'count/km2'}
+        self.assertEqual(set(afscgap.convert.IDENTITY_UNITS), expected)
+
+    def test_unit_pairs_reusable(self):
+        self.assertIn(('g', 'kg'), afscgap.convert.UNIT_PAIRS)
+        self.assertEqual(len(afscgap.convert.UNIT_PAIRS), len(afscgap.convert.CONVERTERS_BY_PAIR))
+
+    def test_build_converter_from_identity(self):
+        converter = afscgap.convert.build_converter('kg', 'g')
+        self.assertIs(converter, afscgap.convert.CONVERTERS['weight']['g'])
+
+    def test_build_converter_chained(self):
+        converter = afscgap.convert.build_converter('km2', 'm2')
+        self.assertAlmostEqual(converter(1), 1000000)
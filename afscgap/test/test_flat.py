@@ -7,10 +7,12 @@ for Data Science and the Environment at UC Berkeley.
 This file is part of afscgap released under the BSD 3-Clause License. See
 LICENSE.md.
 """
+import os
 import unittest
 import unittest.mock
 
 import afscgap.flat
+import afscgap.param
 
 
 class FlatTests(unittest.TestCase):
@@ -25,6 +27,70 @@ class FlatTests(unittest.TestCase):
         afscgap.flat.check_warning(range(0, 4000), self._meta)
         self._warn_function.assert_called()
 
+    def test_check_warning_stops_counting(self):
+        hauls = iter(range(0, 4000))
+        afscgap.flat.check_warning(hauls, self._meta)  # type: ignore
+        self._warn_function.assert_called()
+        self.assertEqual(len(list(hauls)), 4000 - afscgap.flat.WARNING_THRESHOLD - 1)
+
     def test_check_warning_noop(self):
         afscgap.flat.check_warning(range(0, 10), self._meta)
         self._warn_function.assert_not_called()
+
+    def test_check_warning_default(self):
+        self._meta.get_warn_func = unittest.mock.MagicMock(return_value=None)
+        with self.assertWarns(UserWarning) as context:
+            afscgap.flat.check_warning(range(0, 4000), self._meta)  # type: ignore
+        self.assertEqual(str(context.warning), afscgap.flat.LARGE_WARNING)
+        self.assertEqual(context.filename, __file__)
+
+    def test_get_warning_stack_level(self):
+        self.assertEqual(afscgap.flat.get_warning_stack_level(), 1)
+
+    def test_get_warning_stack_level_nested(self):
+        namespace = {}  # type: ignore
+        inner_path = os.path.join(afscgap.flat.PACKAGE_DIR, 'inner.py')
+        exec(compile('def call(x):\n    return x()\n', inner_path, 'exec'), namespace)
+        self.assertEqual(namespace['call'](afscgap.flat.get_warning_stack_level), 2)
+
+    def test_get_hauls_intersection(self):
+        hauls_by_url = {
+            'base/index/year.avro': [1, 2, 3, 5],
+            'base/index/latitude_dd_start.avro': [2, 3],
+            'base/index/latitude_dd_end.avro': [4, 5]
+        }
+        params = {
+            'year': afscgap.param.IntEqualsParam(2025),
+            'latitude_dd': afscgap.param.FloatRangeParam(56, 57)
+        }
+        self._meta.get_base_url = unittest.mock.MagicMock(return_value='base')
+        self._meta.get_presence_only = unittest.mock.MagicMock(return_value=False)
+        self._meta.get_prefetch_depth = unittest.mock.MagicMock(return_value=4)
+
+        with unittest.mock.patch('afscgap.flat_http.get_hauls_for_index_url') as mock_get:
+            mock_get.side_effect = lambda meta, index_filter, url: hauls_by_url[url]
+            hauls = afscgap.flat.get_hauls(params, self._meta)
+
+        self.assertEqual(hauls, {2, 3, 5})
+        self.assertEqual(mock_get.call_count, 3)
+
+    def test_get_required_params(self):
+        params = {
+            'year': afscgap.param.IntEqualsParam(2025),
+            'srvy': afscgap.param.EmptyParam()
+        }
+        required = afscgap.flat.get_required_params(params)
+        self.assertEqual(list(required.keys()), ['year'])
+
+    def test_execute_no_local_filter(self):
+        self._meta.get_limit = unittest.mock.MagicMock(return_value=None)
+        self._meta.get_filter_incomplete = unittest.mock.MagicMock(return_value=False)
+
+        with unittest.mock.patch('afscgap.flat_http.get_all_hauls', return_value=[1]), \
+            unittest.mock.patch('afscgap.flat_http.get_records_for_hauls', return_value=['a']), \
+            unittest.mock.patch('afscgap.flat_local_filter.build_filter') as mock_build:
+            cursor = afscgap.flat.execute({'srvy': afscgap.param.EmptyParam()}, self._meta)
+            records = list(cursor)
+
+        mock_build.assert_not_called()
+        self.assertEqual(records, ['a'])
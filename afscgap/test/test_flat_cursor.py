@@ -80,6 +80,12 @@ class CompleteCursorTests(unittest.TestCase):
         self.assertEqual(dicts[0]['id'], 1)
         self.assertEqual(dicts[1]['id'], 3)
 
+    def test_get_invalid(self):
+        list(self._cursor)
+        invalid = self._cursor.get_invalid()
+        self.assertEqual(invalid.qsize(), 1)
+        self.assertIs(invalid.get(), self._records[1].get_inner())
+
 
 class FlatCursorTests(unittest.TestCase):
 
@@ -110,3 +116,91 @@ class FlatCursorTests(unittest.TestCase):
         self.assertEqual(len(dicts), 2)
         self.assertEqual(dicts[0]['id'], 1)
         self.assertEqual(dicts[1]['id'], 2)
+
+
+class ChainCursorTests(unittest.TestCase):
+
+    def setUp(self):
+        def make_record(target_id):
+            mock = unittest.mock.MagicMock()
+            mock.get_id = unittest.mock.MagicMock(return_value=target_id)
+            mock.to_dict = unittest.mock.MagicMock(return_value={'id': target_id})
+            return mock
+
+        self._inners = [
+            afscgap.flat_cursor.FlatCursor([make_record(1), make_record(2)]),
+            afscgap.flat_cursor.FlatCursor([]),
+            afscgap.flat_cursor.FlatCursor([make_record(3)])
+        ]
+        self._cursor = afscgap.flat_cursor.ChainCursor(self._inners)
+
+    def test_get_attrs(self):
+        self.assertIsNone(self._cursor.get_limit())
+        self.assertFalse(self._cursor.get_filtering_incomplete())
+
+    def test_get_next(self):
+        ids = [x.get_id() for x in self._cursor]  # type: ignore
+        self.assertEqual(ids, [1, 2, 3])
+        self.assertIsNone(self._cursor.get_next())
+
+    def test_to_dicts(self):
+        dicts = list(self._cursor.to_dicts())
+        self.assertEqual(len(dicts), 3)
+        self.assertEqual(dicts[2]['id'], 3)
+
+    def test_empty(self):
+        cursor = afscgap.flat_cursor.ChainCursor([])
+        self.assertIsNone(cursor.get_next())
+
+    def test_to_dict_batches(self):
+        batches = list(self._cursor.to_dict_batches(2))
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(len(batches[0]), 2)
+        self.assertEqual(batches[1][0]['id'], 3)
+
+    def test_to_dict_batches_lazy(self):
+        batches = self._cursor.to_dict_batches(1)
+        first = next(batches)
+        self.assertEqual(first[0]['id'], 1)
+        self.assertEqual(self._cursor.get_next().get_id(), 2)  # type: ignore
+
+    def test_to_dict_batches_invalid(self):
+        with self.assertRaises(RuntimeError):
+            self._cursor.to_dict_batches(0)
+
+    def test_to_batches(self):
+        batches = self._cursor.to_batches(2)
+        first = next(batches)
+        self.assertEqual([x.get_id() for x in first], [1, 2])  # type: ignore
+        second = next(batches)
+        self.assertEqual([x.get_id() for x in second], [3])  # type: ignore
+        self.assertIsNone(next(batches, None))
+
+    def test_to_batches_invalid(self):
+        with self.assertRaises(RuntimeError):
+            self._cursor.to_batches(0)
+
+    def test_get_invalid_empty(self):
+        self.assertTrue(self._cursor.get_invalid().empty())
+
+    def test_get_invalid(self):
+        def make_record(complete):
+            mock = unittest.mock.MagicMock()
+            mock.is_complete = unittest.mock.MagicMock(return_value=complete)
+            mock.get_inner = unittest.mock.MagicMock(return_value={'complete': complete})
+            return mock
+
+        inners = [
+            afscgap.flat_cursor.CompleteCursor(
+                afscgap.flat_cursor.FlatCursor([make_record(False), make_record(True)])
+            ),
+            afscgap.flat_cursor.CompleteCursor(
+                afscgap.flat_cursor.FlatCursor([make_record(False)])
+            )
+        ]
+        cursor = afscgap.flat_cursor.ChainCursor(inners)
+        list(cursor)
+
+        invalid = cursor.get_invalid()
+        self.assertEqual(invalid.qsize(), 2)
+        self.assertIs(cursor.get_invalid(), invalid)
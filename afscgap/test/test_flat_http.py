@@ -7,9 +7,14 @@ for Data Science and the Environment at UC Berkeley.
 This file is part of afscgap released under the BSD 3-Clause License. See
 LICENSE.md.
 """
+import gc
+import io
+import threading
 import unittest
 import unittest.mock
 
+import fastavro
+
 import afscgap.flat_http
 import afscgap.flat_model
 
@@ -70,4 +75,215 @@ class FlatHttpTests(unittest.TestCase):
         self.assertEqual(keys_realized[1], 'b')
         self.assertEqual(keys_realized[2], 'e')
         self.assertEqual(keys_realized[3], 'f')
-        
+
+    def test_get_records_for_hauls(self):
+        records_by_haul = {'a': [1, 2], 'b': [], 'c': [3], 'd': [4, 5, 6], 'e': [7]}
+
+        with unittest.mock.patch('afscgap.flat_http.get_records_for_haul') as mock_get:
+            mock_get.side_effect = lambda meta, haul: records_by_haul[haul]
+            records = afscgap.flat_http.get_records_for_hauls(
+                self._meta_params,
+                ['a', 'b', 'c', 'd', 'e']  # type: ignore
+            )
+            records_realized = list(records)
+
+        self.assertEqual(records_realized, [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(mock_get.call_count, 5)
+
+    def test_get_records_for_hauls_started(self):
+        started = threading.Event()
+
+        def get_records(meta, haul):
+            started.set()
+            return [haul]
+
+        with unittest.mock.patch('afscgap.flat_http.get_records_for_haul') as mock_get:
+            mock_get.side_effect = get_records
+            hauls = ['a', 'b']
+            records = afscgap.flat_http.get_records_for_hauls(
+                self._meta_params,
+                hauls  # type: ignore
+            )
+            self.assertTrue(started.wait(timeout=5))
+            records_realized = list(records)
+
+        self.assertEqual(records_realized, ['a', 'b'])
+
+    def test_get_records_for_hauls_dropped(self):
+        with unittest.mock.patch('afscgap.flat_http.get_records_for_haul') as mock_get:
+            mock_get.side_effect = lambda meta, haul: [haul]
+            with unittest.mock.patch('afscgap.flat_http.stop_prefetch') as mock_stop:
+                hauls = ['a', 'b']
+                records = afscgap.flat_http.get_records_for_hauls(
+                    self._meta_params,
+                    hauls  # type: ignore
+                )
+                del records
+                gc.collect()
+
+        mock_stop.assert_called_once()
+
+    def test_get_records_for_hauls_serial(self):
+        records_by_haul = {'a': [1, 2], 'b': [], 'c': [3]}
+        meta_params = afscgap.flat_model.ExecuteMetaParams(
+            'base_url:',
+            None,
+            None,
+            False,
+            False,
+            False,
+            lambda x: print(x),
+            0
+        )
+
+        with unittest.mock.patch('afscgap.flat_http.get_records_for_haul') as mock_get:
+            mock_get.side_effect = lambda meta, haul: records_by_haul[haul]
+            hauls = ['a', 'b', 'c']
+            records = afscgap.flat_http.get_records_for_hauls(meta_params, hauls)  # type: ignore
+            self.assertEqual(next(records), 1)  # type: ignore
+            self.assertEqual(mock_get.call_count, 1)
+            records_realized = list(records)
+
+        self.assertEqual(records_realized, [2, 3])
+        self.assertEqual(mock_get.call_count, 3)
+
+    def test_get_records_for_hauls_empty(self):
+        records = afscgap.flat_http.get_records_for_hauls(self._meta_params, [])
+        self.assertEqual(len(list(records)), 0)
+
+    def test_get_avro_records(self):
+        schema = {
+            'name': 'Test',
+            'type': 'record',
+            'fields': [{'name': 'value', 'type': 'int'}]
+        }
+        buffer = io.BytesIO()
+        fastavro.writer(buffer, schema, [{'value': 1}, {'value': 2}])
+
+        payload = buffer.getvalue()
+        response = unittest.mock.MagicMock()
+        response.iter_content = unittest.mock.MagicMock(return_value=[payload[:5], payload[5:]])
+
+        records = afscgap.flat_http.get_avro_records(response, 'test_url')
+        values = [x['value'] for x in records]
+        self.assertEqual(values, [1, 2])
+
+    def test_is_non_zero(self):
+        record = {'cpue_kgkm2': 0, 'cpue_nokm2': None, 'weight_kg': 1.2, 'count': 0}
+        self.assertTrue(afscgap.flat_http.is_non_zero(record))
+
+    def test_is_non_zero_zeroed(self):
+        record = {'cpue_kgkm2': 0, 'cpue_nokm2': None, 'weight_kg': 0, 'count': 0}
+        self.assertFalse(afscgap.flat_http.is_non_zero(record))
+
+    def test_get_records_for_haul_presence_only(self):
+        records = self._get_records_for_haul_counts(True, [0, 3, 0])
+        self.assertEqual(list(map(lambda x: x.get_count(), records)), [3])
+
+    def test_get_records_for_haul_not_presence_only(self):
+        records = self._get_records_for_haul_counts(False, [0, 3, 0])
+        self.assertEqual(list(map(lambda x: x.get_count(), records)), [0, 3, 0])
+
+    def test_get_index_records_cached(self):
+        response = self._build_avro_response([{'year': 2021}])
+        requestor = unittest.mock.MagicMock(return_value=response)
+        meta_params = afscgap.flat_model.ExecuteMetaParams(
+            'base_url:',
+            None,
+            None,
+            False,
+            False,
+            False,
+            None
+        )
+        afscgap.flat_http.INDEX_CACHE.clear()
+
+        with unittest.mock.patch('afscgap.flat_http.build_requestor', return_value=requestor):
+            first = list(afscgap.flat_http.get_index_records(meta_params, 'test_url'))
+            second = list(afscgap.flat_http.get_index_records(meta_params, 'test_url'))
+
+        afscgap.flat_http.INDEX_CACHE.clear()
+        self.assertEqual(first, second)
+        self.assertEqual(requestor.call_count, 1)
+
+    def test_get_index_records_custom_requestor(self):
+        response = self._build_avro_response([{'year': 2021}])
+        requestor = unittest.mock.MagicMock(return_value=response)
+        meta_params = afscgap.flat_model.ExecuteMetaParams(
+            'base_url:',
+            requestor,
+            None,
+            False,
+            False,
+            False,
+            None
+        )
+
+        list(afscgap.flat_http.get_index_records(meta_params, 'test_url'))
+        list(afscgap.flat_http.get_index_records(meta_params, 'test_url'))
+        self.assertEqual(requestor.call_count, 2)
+
+    def test_get_avro_records_invalid(self):
+        response = unittest.mock.MagicMock()
+        response.iter_content = unittest.mock.MagicMock(return_value=[b'invalid'])
+
+        with self.assertRaises(RuntimeError):
+            afscgap.flat_http.get_avro_records(response, 'test_url')
+
+    def test_get_avro_records_corrupt_block(self):
+        schema = {
+            'name': 'Test',
+            'type': 'record',
+            'fields': [{'name': 'value', 'type': 'int'}]
+        }
+        buffer = io.BytesIO()
+        fastavro.writer(buffer, schema, [{'value': 1}, {'value': 2}])
+
+        payload = buffer.getvalue()
+        truncated = payload[:len(payload) - 5]
+        response = unittest.mock.MagicMock()
+        response.iter_content = unittest.mock.MagicMock(return_value=[truncated])
+
+        records = afscgap.flat_http.get_avro_records(response, 'test_url')
+
+        with self.assertRaises(RuntimeError):
+            list(records)
+
+    def _get_records_for_haul_counts(self, presence_only, counts):
+        schema = {
+            'name': 'Test',
+            'type': 'record',
+            'fields': [{'name': 'count', 'type': 'int'}]
+        }
+        buffer = io.BytesIO()
+        fastavro.writer(buffer, schema, [{'count': x} for x in counts])
+
+        response = unittest.mock.MagicMock()
+        response.status_code = 200
+        response.iter_content = unittest.mock.MagicMock(return_value=[buffer.getvalue()])
+
+        meta_params = afscgap.flat_model.ExecuteMetaParams(
+            'base_url:',
+            lambda x: response,
+            None,
+            False,
+            presence_only,
+            False,
+            lambda x: print(x)
+        )
+        haul = afscgap.flat_model.HaulKey(2025, 'Gulf of Alaska', 123)
+        return afscgap.flat_http.get_records_for_haul(meta_params, haul)
+
+    def _build_avro_response(self, records):
+        schema = {
+            'name': 'Test',
+            'type': 'record',
+            'fields': [{'name': 'year', 'type': 'int'}]
+        }
+        buffer = io.BytesIO()
+        fastavro.writer(buffer, schema, records)
+
+        response = unittest.mock.MagicMock()
+        response.status_code = 200
+        response.iter_content = unittest.mock.MagicMock(return_value=[buffer.getvalue()])
+        return response
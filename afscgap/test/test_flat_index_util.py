@@ -14,12 +14,28 @@ import afscgap.flat_index_util
 import afscgap.param
 
 
+class GetDatePrefixTests(unittest.TestCase):
+
+    def test_datetime(self):
+        result = afscgap.flat_index_util.get_date_prefix('2025-01-13T13:50:50Z')
+        self.assertEqual(result, '2025-01-13')
+
+    def test_date(self):
+        result = afscgap.flat_index_util.get_date_prefix('2025-01-13')
+        self.assertEqual(result, '2025-01-13')
+
+
 class StringEqIndexFilterTests(unittest.TestCase):
 
     def setUp(self):
-        param = unittest.mock.MagicMock()
-        param.get_value = unittest.mock.MagicMock(return_value='test')
-        self._index_filter = afscgap.flat_index_util.StringEqIndexFilter('index', param)
+        self._param = unittest.mock.MagicMock()
+        self._param.get_value = unittest.mock.MagicMock(return_value='test')
+        self._index_filter = afscgap.flat_index_util.StringEqIndexFilter('index', self._param)
+
+    def test_value_read_once(self):
+        self._index_filter.get_matches('test')
+        self._index_filter.get_matches('other')
+        self.assertEqual(self._param.get_value.call_count, 1)
 
     def test_matches(self):
         self.assertTrue(self._index_filter.get_matches('test'))
@@ -37,10 +53,16 @@ class StringEqIndexFilterTests(unittest.TestCase):
 class StringRangeIndexFilterTests(unittest.TestCase):
 
     def setUp(self):
-        param = unittest.mock.MagicMock()
-        param.get_low = unittest.mock.MagicMock(return_value='b')
-        param.get_high = unittest.mock.MagicMock(return_value='d')
-        self._index_filter = afscgap.flat_index_util.StringRangeIndexFilter('index', param)
+        self._param = unittest.mock.MagicMock()
+        self._param.get_low = unittest.mock.MagicMock(return_value='b')
+        self._param.get_high = unittest.mock.MagicMock(return_value='d')
+        self._index_filter = afscgap.flat_index_util.StringRangeIndexFilter('index', self._param)
+
+    def test_bounds_read_once(self):
+        self._index_filter.get_matches('a')
+        self._index_filter.get_matches('c')
+        self.assertEqual(self._param.get_low.call_count, 1)
+        self.assertEqual(self._param.get_high.call_count, 1)
 
     def test_out_low(self):
         self.assertFalse(self._index_filter.get_matches('a'))
@@ -124,6 +146,9 @@ class FloatEqIndexFilterTests(unittest.TestCase):
     def test_approx_matches(self):
         self.assertTrue(self._index_filter.get_matches(123.454))
 
+    def test_string(self):
+        self.assertTrue(self._index_filter.get_matches('123.45'))
+
     def test_none(self):
         self.assertFalse(self._index_filter.get_matches(None))
 
@@ -163,6 +188,18 @@ class FloatRangeIndexFilterTests(unittest.TestCase):
     def test_out_high(self):
         self.assertFalse(self._index_filter.get_matches(5))
 
+    def test_string(self):
+        self.assertTrue(self._index_filter.get_matches('3.00'))
+
+    def test_different_magnitude(self):
+        param = unittest.mock.MagicMock()
+        param.get_low = unittest.mock.MagicMock(return_value=9)
+        param.get_high = unittest.mock.MagicMock(return_value=11)
+        index_filter = afscgap.flat_index_util.FloatRangeIndexFilter('index', param)
+        self.assertTrue(index_filter.get_matches('9.50'))
+        self.assertTrue(index_filter.get_matches(10.5))
+        self.assertFalse(index_filter.get_matches('100.00'))
+
     def test_none(self):
         self.assertFalse(self._index_filter.get_matches(None))
 
@@ -298,6 +335,16 @@ class LogicalOrIndexFilterTests(unittest.TestCase):
     def test_empty(self):
         with self.assertRaises(RuntimeError):
             afscgap.flat_index_util.LogicalOrIndexFilter([])
+
+    def test_short_circuit(self):
+        second_filter = self._make_inner_filter(2, 'test')
+        second_filter.get_matches = unittest.mock.MagicMock(return_value=False)
+        index_filter = afscgap.flat_index_util.LogicalOrIndexFilter([
+            self._make_inner_filter(1, 'test'),
+            second_filter
+        ])
+        self.assertTrue(index_filter.get_matches(1))
+        second_filter.get_matches.assert_not_called()
     
     def test_unmatched(self):
         index_filter = afscgap.flat_index_util.LogicalOrIndexFilter([
@@ -410,6 +457,18 @@ class MakeFilterTests(unittest.TestCase):
         self.assertEqual(len(filters), 1)
         self.assertFalse(filters[0].get_matches('other'))
     
+    def test_single_index_unwrapped(self):
+        param = afscgap.param.IntEqualsParam(2025)
+        filters = list(afscgap.flat_index_util.make_filters('year', param, True))
+        self.assertEqual(len(filters), 1)
+        self.assertIsInstance(filters[0], afscgap.flat_index_util.IntEqIndexFilter)
+
+    def test_multiple_indicies_wrapped(self):
+        param = afscgap.param.FloatEqualsParam(56)
+        filters = list(afscgap.flat_index_util.make_filters('latitude_dd', param, True))
+        self.assertEqual(len(filters), 1)
+        self.assertIsInstance(filters[0], afscgap.flat_index_util.LogicalOrIndexFilter)
+
     def test_presence_only(self):
         param = afscgap.param.StrEqualsParam('test')
         filters = afscgap.flat_index_util.make_filters('common_name', param, False)
@@ -96,6 +96,17 @@ class LogcalAndLocalFilterTests(unittest.TestCase):
         target = self._make_filter([True, True])
         self.assertTrue(target.matches(None))
 
+    def test_short_circuit(self):
+        inner_filters = [self._make_inner_filter(False), self._make_inner_filter(True)]
+        target = afscgap.flat_local_filter.LogicalAndLocalFilter(inner_filters)
+        self.assertFalse(target.matches(1))  # type: ignore
+        inner_filters[1].matches.assert_not_called()
+
+    def test_reused(self):
+        target = self._make_filter([True, False])
+        self.assertFalse(target.matches(1))
+        self.assertFalse(target.matches(2))
+
     def _make_filter(self, values):
         inner_filters = map(lambda x: self._make_inner_filter(x), values)
         return afscgap.flat_local_filter.LogicalAndLocalFilter(inner_filters)
@@ -176,6 +187,16 @@ class BuildFilterTests(unittest.TestCase):
         example = self._build_example(2025, 'GOA', None)
         self.assertTrue(self._local_filter.matches(example))
 
+    def test_single(self):
+        params = {'year': afscgap.param.IntRangeParam(2024, 2026)}
+        local_filter = afscgap.flat_local_filter.build_filter(params)
+        self.assertIsInstance(local_filter, afscgap.flat_local_filter.RangeLocalFilter)
+        self.assertTrue(local_filter.matches(self._build_example(2025, 'GOA', 123)))
+
+    def test_no_params(self):
+        local_filter = afscgap.flat_local_filter.build_filter({})
+        self.assertTrue(local_filter.matches(self._build_example(2025, 'GOA', 123)))
+
     def _build_example(self, year, survey, count):
         mock = unittest.mock.MagicMock()
         mock.get_year = unittest.mock.MagicMock(return_value=year)
@@ -108,6 +108,9 @@ class HaulKeyTests(unittest.TestCase):
     def test_get_haul(self):
         self.assertEqual(self._key.get_haul(), 123)
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self._key, '__dict__'))
+
     def test_get_key_same(self):
         self.assertEqual(self._key.get_key(), self._key_same.get_key())
     
@@ -143,9 +146,20 @@ class HaulKeyTests(unittest.TestCase):
         self.assertNotEqual(self._key, self._key_other_survey)
         self.assertNotEqual(self._key, self._key_other_haul)
 
+    def test_neq_other_type(self):
+        self.assertNotEqual(self._key, self._key.get_key())
+
+    def test_set_operations(self):
+        keys = {self._key, self._key_other_year} & {self._key_same, self._key_other_haul}
+        self.assertEqual(keys, {self._key})
+
 
 class FlatRecordTests(unittest.TestCase):
 
+    def test_slots(self):
+        record = afscgap.flat_model.FlatRecord({'year': 2025})
+        self.assertFalse(hasattr(record, '__dict__'))
+
     def test_get_year(self):
         self._test_getter('year', 2025, lambda x: x.get_year())
 
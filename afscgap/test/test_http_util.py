@@ -29,3 +29,55 @@ class UtilTests(unittest.TestCase):
 
     def test_build_requestor(self):
         self.assertIsNotNone(afscgap.http_util.build_requestor())
+
+    def test_build_requestor_shared_session(self):
+        with unittest.mock.patch.object(afscgap.http_util.SESSION, 'get') as mock_get:
+            requestor = afscgap.http_util.build_requestor(stream=True)
+            requestor('http://example.com')
+
+        mock_get.assert_called_once_with(
+            'http://example.com',
+            timeout=afscgap.http_util.TIMEOUT,
+            stream=True
+        )
+
+    def test_build_session(self):
+        session = afscgap.http_util.build_session()
+        adapter = session.get_adapter('https://data.pyafscgap.org')
+        self.assertEqual(adapter._pool_maxsize, afscgap.http_util.POOL_SIZE)  # type: ignore
+        self.assertEqual(adapter.max_retries.total, afscgap.http_util.MAX_RETRIES)  # type: ignore
+        self.assertTrue(adapter._pool_block)  # type: ignore
+
+
+class ResponseCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self._cache = afscgap.http_util.ResponseCache(2, 10)
+
+    def test_get_missing(self):
+        self.assertIsNone(self._cache.get('a'))
+
+    def test_put_get(self):
+        self._cache.put('a', b'1')
+        self.assertEqual(self._cache.get('a'), b'1')
+
+    def test_expired(self):
+        with unittest.mock.patch('time.monotonic', return_value=0):
+            self._cache.put('a', b'1')
+
+        with unittest.mock.patch('time.monotonic', return_value=11):
+            self.assertIsNone(self._cache.get('a'))
+
+    def test_evict_least_recent(self):
+        self._cache.put('a', b'1')
+        self._cache.put('b', b'2')
+        self._cache.get('a')
+        self._cache.put('c', b'3')
+        self.assertEqual(self._cache.get('a'), b'1')
+        self.assertIsNone(self._cache.get('b'))
+        self.assertEqual(self._cache.get('c'), b'3')
+
+    def test_clear(self):
+        self._cache.put('a', b'1')
+        self._cache.clear()
+        self.assertIsNone(self._cache.get('a'))
@@ -0,0 +1,48 @@
+"""
+Tests for backend-agnostic parameters.
+
+(c) 2025 Regents of University of California / The Eric and Wendy Schmidt Center
+for Data Science and the Environment at UC Berkeley.
+
+This file is part of afscgap released under the BSD 3-Clause License. See
+LICENSE.md.
+"""
+import unittest
+
+import afscgap.param
+
+
+class ParamTests(unittest.TestCase):
+
+    def test_equals(self):
+        param = afscgap.param.IntEqualsParam(2025)
+        self.assertEqual(param.get_value(), 2025)
+        self.assertEqual(param.get_filter_type(), 'equals')
+        self.assertFalse(param.get_is_ignorable())
+
+    def test_range(self):
+        param = afscgap.param.FloatRangeParam(56, None)
+        self.assertEqual(param.get_low(), 56)
+        self.assertIsNone(param.get_high())
+        self.assertEqual(param.get_filter_type(), 'range')
+
+    def test_empty(self):
+        self.assertTrue(afscgap.param.EmptyParam().get_is_ignorable())
+
+    def test_field_param(self):
+        inner = afscgap.param.StrEqualsParam('GOA')
+        param = afscgap.param.FieldParam('srvy', inner)
+        self.assertEqual(param.get_field(), 'srvy')
+        self.assertIs(param.get_param(), inner)
+
+    def test_slots(self):
+        params = [
+            afscgap.param.EmptyParam(),
+            afscgap.param.StrEqualsParam('GOA'),
+            afscgap.param.StrRangeParam('AI', 'GOA'),
+            afscgap.param.IntRangeParam(2020, 2025),
+            afscgap.param.FloatEqualsParam(1.5),
+            afscgap.param.FieldParam('srvy', afscgap.param.EmptyParam())
+        ]
+        for param in params:
+            self.assertFalse(hasattr(param, '__dict__'))
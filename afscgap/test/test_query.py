@@ -0,0 +1,290 @@
+"""
+Tests for the Query entrypoint / builder.
+
+(c) 2025 Regents of University of California / The Eric and Wendy Schmidt Center
+for Data Science and the Environment at UC Berkeley.
+
+This file is part of afscgap released under the BSD 3-Clause License. See
+LICENSE.md.
+"""
+import subprocess
+import sys
+import unittest
+import unittest.mock
+
+import afscgap
+import afscgap.flat_cursor
+
+
+class QueryTests(unittest.TestCase):
+
+    def setUp(self):
+        self._query = afscgap.Query()
+
+    def test_default_empty(self):
+        params = self._execute_for_params()
+        self.assertEqual(len(params), 0)
+
+    def test_filter_equals(self):
+        self._query.filter_year(eq=2021)
+        params = self._execute_for_params()
+        self.assertEqual(params['year'].get_filter_type(), 'equals')
+        self.assertEqual(params['year'].get_value(), 2021)
+
+    def test_filter_range(self):
+        self._query.filter_srvy(min_val='AI', max_val='GOA')
+        params = self._execute_for_params()
+        self.assertEqual(params['srvy'].get_filter_type(), 'range')
+        self.assertEqual(params['srvy'].get_data_type(), 'str')
+        self.assertEqual(params['srvy'].get_low(), 'AI')
+        self.assertEqual(params['srvy'].get_high(), 'GOA')
+
+    def test_filter_both(self):
+        with self.assertRaises(RuntimeError):
+            self._query.filter_year(eq=2021, min_val=2020)
+
+    def test_filter_both_max(self):
+        with self.assertRaises(RuntimeError):
+            self._query.filter_year(eq=2021, max_val=2022)
+
+    def test_filter_min_only(self):
+        self._query.filter_year(min_val=2020)
+        params = self._execute_for_params()
+        self.assertEqual(params['year'].get_filter_type(), 'range')
+        self.assertEqual(params['year'].get_low(), 2020)
+        self.assertIsNone(params['year'].get_high())
+
+    def test_filter_ords_dict(self):
+        with self.assertRaises(RuntimeError):
+            self._query.filter_latitude({'$between': [56, 57]})  # type: ignore
+
+    def test_filter_ords_dict_range(self):
+        with self.assertRaises(RuntimeError):
+            self._query.filter_srvy(min_val={'$gte': 'AI'}, max_val='GOA')  # type: ignore
+
+    def test_filter_overwrite(self):
+        self._query.filter_year(eq=2021)
+        self._query.filter_year(min_val=2020)
+        params = self._execute_for_params()
+        self.assertEqual(params['year'].get_filter_type(), 'range')
+
+    def test_filter_clear(self):
+        self._query.filter_year(eq=2021)
+        self._query.filter_year()
+        params = self._execute_for_params()
+        self.assertNotIn('year', params)
+
+    def test_filter_units(self):
+        self._query.filter_weight(eq=1000, units='g')
+        params = self._execute_for_params()
+        self.assertAlmostEqual(params['weight_kg'].get_value(), 1)
+
+    def test_filter_units_range(self):
+        self._query.filter_depth(min_val=1, max_val=2, units='km')
+        params = self._execute_for_params()
+        self.assertAlmostEqual(params['depth_m'].get_low(), 1000)
+        self.assertAlmostEqual(params['depth_m'].get_high(), 2000)
+
+    def test_filter_units_default(self):
+        with unittest.mock.patch('afscgap.convert.get_converter') as mock_get:
+            self._query.filter_depth(eq=12.5)
+        params = self._execute_for_params()
+        mock_get.assert_not_called()
+        self.assertEqual(params['depth_m'].get_value(), 12.5)
+
+    def test_filter_distance_fished(self):
+        self._query.filter_distance_fished(min_val=500, max_val=1500)
+        params = self._execute_for_params()
+        self.assertAlmostEqual(params['distance_fished_km'].get_low(), 0.5)
+        self.assertAlmostEqual(params['distance_fished_km'].get_high(), 1.5)
+
+    def test_filter_distance_fished_km(self):
+        with unittest.mock.patch('afscgap.convert.get_converter') as mock_get:
+            self._query.filter_distance_fished(eq=2, units='km')
+        params = self._execute_for_params()
+        mock_get.assert_not_called()
+        self.assertEqual(params['distance_fished_km'].get_value(), 2)
+
+    def test_filter_units_clear(self):
+        self._query.filter_depth(eq=1, units='km')
+        self._query.filter_depth(units='km')
+        params = self._execute_for_params()
+        self.assertNotIn('depth_m', params)
+
+    def test_filter_cpue_weight(self):
+        self._query.filter_cpue_weight(eq=1, units='kg/ha')
+        self._query.filter_cpue_weight(eq=2, units='kg/km2')
+        params = self._execute_for_params()
+        self.assertNotIn('cpue_kgha', params)
+        self.assertEqual(params['cpue_kgkm2'].get_value(), 2)
+
+    def test_filter_cpue_count(self):
+        self._query.filter_cpue_count(min_val=1, max_val=2, units='count/km2')
+        params = self._execute_for_params()
+        self.assertEqual(params['cpue_nokm2'].get_filter_type(), 'range')
+        self.assertNotIn('cpue_noha', params)
+
+    def test_filter_cpue_weight_invalid(self):
+        with self.assertRaises(RuntimeError):
+            self._query.filter_cpue_weight(eq=1, units='invalid')
+
+    def test_params_reused(self):
+        self._query.filter_year(eq=2021)
+        params_first = self._execute_for_params()
+        params_second = self._execute_for_params()
+        self.assertIs(params_first, params_second)
+
+    def test_params_invalidated(self):
+        self._query.filter_year(eq=2021)
+        params_first = self._execute_for_params()
+        self._query.filter_srvy(eq='GOA')
+        params_second = self._execute_for_params()
+        self.assertNotIn('srvy', params_first)
+        self.assertIn('srvy', params_second)
+
+    def test_params_read_only(self):
+        self._query.filter_year(eq=2021)
+        params = self._execute_for_params()
+        with self.assertRaises(TypeError):
+            params['srvy'] = None
+
+    def test_meta_reused(self):
+        meta_first = self._execute_for_meta()
+        meta_second = self._execute_for_meta()
+        self.assertIs(meta_first, meta_second)
+
+    def test_meta_invalidated(self):
+        meta_first = self._execute_for_meta()
+        self._query.set_limit(10)
+        meta_second = self._execute_for_meta()
+        self.assertIsNone(meta_first.get_limit())
+        self.assertEqual(meta_second.get_limit(), 10)
+
+    def test_meta_unchanged(self):
+        self._query.set_presence_only(False)
+        meta_first = self._execute_for_meta()
+        self._query.set_presence_only(False)
+        meta_second = self._execute_for_meta()
+        self.assertIs(meta_first, meta_second)
+
+    def test_prefetch_depth(self):
+        self._query.set_prefetch_depth(0)
+        meta = self._execute_for_meta()
+        self.assertEqual(meta.get_prefetch_depth(), 0)
+
+    def test_copy(self):
+        self._query.filter_srvy(eq='GOA').set_limit(10)
+        copied = self._query.copy().filter_year(eq=2021)
+        params = self._execute_for_params()
+        self.assertNotIn('year', params)
+
+        with unittest.mock.patch('afscgap.flat.execute') as mock_execute:
+            copied.execute()
+            copied_params = mock_execute.call_args[0][0]
+            copied_meta = mock_execute.call_args[0][1]
+
+        self.assertEqual(copied_params['year'].get_value(), 2021)
+        self.assertEqual(copied_params['srvy'].get_value(), 'GOA')
+        self.assertEqual(copied_meta.get_limit(), 10)
+
+    def test_copy_subclass(self):
+        class SlottedQuery(afscgap.Query):
+            __slots__ = ('_label',)
+
+        class DictQuery(afscgap.Query):
+            pass
+
+        slotted = SlottedQuery()
+        slotted._label = 'test'  # type: ignore
+        slotted_copy = slotted.copy()
+        self.assertIsInstance(slotted_copy, SlottedQuery)
+        self.assertEqual(slotted_copy._label, 'test')  # type: ignore
+
+        with_dict = DictQuery()
+        with_dict.label = 'test'  # type: ignore
+        dict_copy = with_dict.copy()
+        self.assertIsInstance(dict_copy, DictQuery)
+        self.assertEqual(dict_copy.label, 'test')  # type: ignore
+
+    def test_filter_from_dict(self):
+        self._query.filter_from_dict({
+            'year': {'eq': 2021},
+            'latitude': {'min_val': 56, 'max_val': 57, 'units': 'dd'}
+        })
+        params = self._execute_for_params()
+        self.assertEqual(params['year'].get_value(), 2021)
+        self.assertEqual(params['latitude_dd'].get_low(), 56)
+
+    def test_filter_from_dict_unknown(self):
+        with self.assertRaises(RuntimeError):
+            self._query.filter_from_dict({'unknown': {'eq': 1}})
+
+    def test_chain(self):
+        result = self._query.filter_year(eq=2021).filter_srvy(eq='GOA')
+        self.assertIs(result, self._query)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self._query.unknown_attribute = 1  # type: ignore
+
+    def test_execute_many(self):
+        queries = [afscgap.Query().filter_year(eq=2021), afscgap.Query().filter_year(eq=2022)]
+        cursors = [self._make_cursor([1, 2]), self._make_cursor([3])]
+
+        with unittest.mock.patch('afscgap.flat.execute', side_effect=cursors) as mock_execute:
+            cursor = afscgap.execute_many(queries, max_concurrency=1)
+            ids = [x.get_id() for x in cursor]  # type: ignore
+
+        self.assertEqual(mock_execute.call_count, 2)
+        self.assertEqual(ids, [1, 2, 3])
+
+    def test_execute_many_concurrent(self):
+        queries = [afscgap.Query().filter_year(eq=x) for x in range(2010, 2015)]
+
+        def execute(params, meta):
+            return self._make_cursor([params['year'].get_value()])
+
+        with unittest.mock.patch('afscgap.flat.execute', side_effect=execute):
+            cursor = afscgap.execute_many(queries)
+            ids = [x.get_id() for x in cursor]  # type: ignore
+
+        self.assertEqual(ids, list(range(2010, 2015)))
+
+    def test_import_deferred(self):
+        command = 'import sys, afscgap; print(sorted(sys.modules.keys()))'
+        result = subprocess.run([sys.executable, '-c', command], capture_output=True, text=True)
+        modules = result.stdout
+        self.assertIn("'afscgap.cursor'", modules)
+        self.assertNotIn("'afscgap.flat'", modules)
+        self.assertNotIn("'requests'", modules)
+        self.assertNotIn("'fastavro'", modules)
+
+    def test_execute_all(self):
+        queries = [afscgap.Query().filter_year(eq=x) for x in range(2010, 2015)]
+
+        def execute(params, meta):
+            return self._make_cursor([params['year'].get_value()])
+
+        with unittest.mock.patch('afscgap.flat.execute', side_effect=execute):
+            cursors = afscgap.execute_all(queries)
+
+        ids = [cursor.get_next().get_id() for cursor in cursors]  # type: ignore
+        self.assertEqual(ids, list(range(2010, 2015)))
+
+    def _make_cursor(self, ids):
+        def make_record(target_id):
+            mock = unittest.mock.MagicMock()
+            mock.get_id = unittest.mock.MagicMock(return_value=target_id)
+            return mock
+
+        return afscgap.flat_cursor.FlatCursor(list(map(make_record, ids)))
+
+    def _execute_for_params(self):
+        with unittest.mock.patch('afscgap.flat.execute') as mock_execute:
+            self._query.execute()
+            return mock_execute.call_args[0][0]
+
+    def _execute_for_meta(self):
+        with unittest.mock.patch('afscgap.flat.execute') as mock_execute:
+            self._query.execute()
+            return mock_execute.call_args[0][1]
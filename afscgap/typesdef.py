@@ -9,18 +9,20 @@ LICENSE.md.
 """
 import typing
 
-import requests
+if typing.TYPE_CHECKING:
+    import requests
 
 
 OPT_FLOAT = typing.Optional[float]
 OPT_INT = typing.Optional[int]
 OPT_STR = typing.Optional[str]
 
+# Deprecated: no longer used within afscgap but kept for compatibility with external code.
 STR_OR_DICT = typing.Union[str, dict]
 RANGE_TUPLE = typing.Tuple[float]
 FLOAT_PARAM = typing.Optional[typing.Union[float, dict, RANGE_TUPLE]]
 INT_PARAM = typing.Optional[typing.Union[int, dict, RANGE_TUPLE]]
 STR_PARAM = typing.Optional[STR_OR_DICT]
 
-REQUESTOR = typing.Callable[[str], requests.Response]
+REQUESTOR = typing.Callable[[str], 'requests.Response']
 OPT_REQUESTOR = typing.Optional[REQUESTOR]